@@ -3,7 +3,9 @@
 import logging
 from typing import List, Dict, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
@@ -34,6 +36,29 @@ class DioceseScraper:
         }
     }
     
+    # Church-listing container patterns, split by matching cost: literal
+    # class names use bs4's fast attribute lookup, the callable matcher
+    # runs a Python function per tag and is only worth trying last
+    CHEAP_PATTERNS = [
+        # Pattern 1: Churches in a list/table
+        {'container': 'div', 'class': 'church-listing'},
+        {'container': 'article', 'class': 'church'},
+        {'container': 'li', 'class': 'church-item'},
+        # Pattern 2: WordPress-style posts
+        {'container': 'article', 'class': 'post'},
+    ]
+    EXPENSIVE_PATTERNS = [
+        # Pattern 3: Generic divs with church data
+        {'container': 'div', 'class': lambda x: x and 'church' in str(x).lower()}
+    ]
+
+    # Precomputed state -> diocese lookup (each state belongs to one diocese)
+    _STATE_TO_DIOCESE = {
+        state: key
+        for key, cfg in DIOCESE_CONFIGS.items()
+        for state in cfg.get('states', [])
+    }
+
     def __init__(self, config, location_service):
         self.config = config
         self.location_service = location_service
@@ -41,15 +66,20 @@ class DioceseScraper:
         self.session.headers.update({
             'User-Agent': config.get('scraping.user_agent', 'CopticServiceEventsBot/1.0')
         })
+        # Pool enough keep-alive connections for parallel diocese discovery
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def detect_diocese_for_location(self, lat: float, lon: float, state: str = None) -> Optional[str]:
         """Detect which diocese covers the user's location"""
-        # If state is provided, use it to determine diocese
+        # If state is provided, use it to determine diocese (O(1) table lookup)
         if state:
-            for diocese_key, diocese_config in self.DIOCESE_CONFIGS.items():
-                if state in diocese_config.get('states', []):
-                    logger.info(f"Detected diocese: {diocese_config['name']} for state {state}")
-                    return diocese_key
+            diocese_key = self._STATE_TO_DIOCESE.get(state)
+            if diocese_key:
+                diocese_config = self.DIOCESE_CONFIGS[diocese_key]
+                logger.info(f"Detected diocese: {diocese_config['name']} for state {state}")
+                return diocese_key
         
         # TODO: More sophisticated location-based diocese detection
         # For now, return the first configured diocese
@@ -81,7 +111,7 @@ class DioceseScraper:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self._parse_html(response.content)
             
             # Parse church listings - these patterns may vary by diocese
             churches = self._parse_church_directory(soup, diocese_url, diocese_config['name'])
@@ -93,37 +123,35 @@ class DioceseScraper:
         
         return churches
     
+    @staticmethod
+    def _parse_html(content: bytes) -> BeautifulSoup:
+        """Parse HTML with the C-backed lxml parser, falling back to html.parser"""
+        try:
+            return BeautifulSoup(content, 'lxml')
+        except Exception:
+            return BeautifulSoup(content, 'html.parser')
+
     def _parse_church_directory(self, soup: BeautifulSoup, base_url: str, diocese_name: str) -> List[Dict[str, str]]:
         """Parse church directory HTML - customize based on diocese website structure"""
         churches = []
-        
-        # Common patterns for church listings
-        patterns = [
-            # Pattern 1: Churches in a list/table
-            {'container': 'div', 'class': 'church-listing'},
-            {'container': 'article', 'class': 'church'},
-            {'container': 'li', 'class': 'church-item'},
-            # Pattern 2: WordPress-style posts
-            {'container': 'article', 'class': 'post'},
-            # Pattern 3: Generic divs with church data
-            {'container': 'div', 'class': lambda x: x and 'church' in str(x).lower()}
-        ]
-        
-        # Try each pattern
-        for pattern in patterns:
-            containers = soup.find_all(pattern['container'], class_=pattern.get('class'))
-            
-            if containers:
-                logger.info(f"Found {len(containers)} church containers using pattern: {pattern}")
-                
-                for container in containers:
-                    church = self._extract_church_info(container, base_url, diocese_name)
-                    if church:
-                        churches.append(church)
-                
-                if churches:
-                    break  # Found churches, stop trying patterns
-        
+
+        # Try each pattern, cheap literal class names before the callable
+        # matcher (which bs4 must invoke on every tag in the document)
+        for patterns in (self.CHEAP_PATTERNS, self.EXPENSIVE_PATTERNS):
+            for pattern in patterns:
+                containers = soup.find_all(pattern['container'], class_=pattern.get('class'))
+
+                if containers:
+                    logger.info(f"Found {len(containers)} church containers using pattern: {pattern}")
+
+                    for container in containers:
+                        church = self._extract_church_info(container, base_url, diocese_name)
+                        if church:
+                            churches.append(church)
+
+                    if churches:
+                        return churches  # Found churches, stop trying patterns
+
         # Fallback: Look for links with "church" or location names
         if not churches:
             churches = self._fallback_church_extraction(soup, base_url, diocese_name)
@@ -241,6 +269,8 @@ class DioceseScraper:
         """Filter churches within radius of user location"""
         filtered = []
         
+        with_coords = []
+
         for church in churches:
             # Try to geocode church if no coordinates
             if 'latitude' not in church or not church['latitude']:
@@ -250,28 +280,36 @@ class DioceseScraper:
                     address_parts.append(church['address'])
                 if church.get('city') and church.get('state'):
                     address_parts.append(f"{church['city']}, {church['state']}")
-                
+
                 if address_parts:
                     address = ', '.join(address_parts)
                     coords = self.location_service.geocode_address(address)
                     if coords:
                         church['latitude'], church['longitude'] = coords
-            
-            # Check distance
+
             if church.get('latitude') and church.get('longitude'):
-                distance = self.location_service.calculate_distance(
-                    user_lat, user_lon, 
-                    church['latitude'], church['longitude']
-                )
-                church['distance_miles'] = round(distance, 1)
-                
-                if distance <= radius_miles:
-                    filtered.append(church)
+                with_coords.append(church)
             else:
                 # Include churches without coordinates (will try to geocode later)
                 filtered.append(church)
-        
+
+        if with_coords:
+            # One vectorized haversine pass over all church coordinates
+            lat2 = np.radians(np.fromiter((c['latitude'] for c in with_coords), dtype=np.float64))
+            lon2 = np.radians(np.fromiter((c['longitude'] for c in with_coords), dtype=np.float64))
+            lat1 = np.radians(user_lat)
+            lon1 = np.radians(user_lon)
+
+            a = (np.sin((lat2 - lat1) / 2) ** 2
+                 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+            distances = 3959 * 2 * np.arcsin(np.sqrt(a))  # Earth radius in miles
+
+            for church, distance in zip(with_coords, distances):
+                church['distance_miles'] = round(float(distance), 1)
+                if distance <= radius_miles:
+                    filtered.append(church)
+
         # Sort by distance
         filtered.sort(key=lambda x: x.get('distance_miles', float('inf')))
-        
+
         return filtered
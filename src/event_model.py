@@ -1,11 +1,38 @@
 """Event data model"""
 
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import json
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, List
 
+# Constant pieces of the Google Calendar event payload, built once
+_CAL_TIMEZONE = 'America/New_York'  # TODO: Make configurable
+_CAL_REMINDERS = {
+    'useDefault': False,
+    'overrides': [
+        {'method': 'popup', 'minutes': 24 * 60},  # 1 day before
+        {'method': 'popup', 'minutes': 60},  # 1 hour before
+    ],
+}
 
-@dataclass
+# (attribute, template) pairs for the simple description lines, in order
+_DESC_FIELDS = (
+    ('contact_person', '👤 Contact: {}'),
+    ('contact_email', '📧 Email: {}'),
+    ('contact_phone', '📞 Phone: {}'),
+    ('registration_link', '🔗 Register: {}'),
+    ('registration_deadline', '⏰ Registration Deadline: {}'),
+)
+
+
+@lru_cache(maxsize=1024)
+def _dump_materials(materials: tuple) -> str:
+    """Serialize a materials tuple once; identical lists share the result"""
+    return json.dumps(list(materials))
+
+
+@dataclass(slots=True)
 class ServiceEvent:
     """Represents a service/volunteer event"""
     
@@ -39,6 +66,7 @@ class ServiceEvent:
     source_url: Optional[str] = None
     image_url: Optional[str] = None
     diocese: Optional[str] = None
+    distance_miles: Optional[float] = None
     
     # Mission trip specific
     is_mission_trip: bool = False
@@ -50,40 +78,40 @@ class ServiceEvent:
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
     
-    def to_dict(self):
-        """Convert to dictionary"""
-        return asdict(self)
+    @property
+    def materials_needed_json(self) -> Optional[str]:
+        """JSON-serialized materials list, memoized across identical lists"""
+        if not self.materials_needed:
+            return None
+        return _dump_materials(tuple(self.materials_needed))
+
     
     def to_calendar_event(self):
         """Convert to Google Calendar event format"""
         start_datetime = f"{self.date}T{self.time}:00"
-        
+
         # Calculate end time (default 2 hours if not specified)
         if self.end_time:
             end_datetime = f"{self.date}T{self.end_time}:00"
         else:
-            from datetime import datetime, timedelta
-            start = datetime.fromisoformat(start_datetime)
-            end = start + timedelta(hours=2)
-            end_datetime = end.isoformat()
-        
-        description_parts = []
-        if self.description:
-            description_parts.append(self.description)
+            # Cheap string arithmetic unless adding 2 hours wraps past midnight
+            hh, _, mm = self.time.partition(':')
+            end_hour = int(hh) + 2
+            if end_hour < 24:
+                end_datetime = f"{self.date}T{end_hour:02d}:{mm}:00"
+            else:
+                start = datetime.fromisoformat(start_datetime)
+                end_datetime = (start + timedelta(hours=2)).isoformat()
         
+        description_parts = [self.description] if self.description else []
         description_parts.append(f"\n\n📍 Location: {self.location}")
-        
-        if self.contact_person:
-            description_parts.append(f"👤 Contact: {self.contact_person}")
-        if self.contact_email:
-            description_parts.append(f"📧 Email: {self.contact_email}")
-        if self.contact_phone:
-            description_parts.append(f"📞 Phone: {self.contact_phone}")
-        if self.registration_link:
-            description_parts.append(f"🔗 Register: {self.registration_link}")
-        if self.registration_deadline:
-            description_parts.append(f"⏰ Registration Deadline: {self.registration_deadline}")
-        if self.capacity and self.spots_available:
+        description_parts.extend(
+            template.format(value)
+            for attr, template in _DESC_FIELDS
+            if (value := getattr(self, attr))
+        )
+        # is-not-None so a full event (0 spots left) still shows its line
+        if self.capacity is not None and self.spots_available is not None:
             description_parts.append(f"👥 Spots: {self.spots_available}/{self.capacity}")
         if self.requirements:
             description_parts.append(f"📋 Requirements: {self.requirements}")
@@ -105,19 +133,40 @@ class ServiceEvent:
             'description': '\n'.join(description_parts),
             'start': {
                 'dateTime': start_datetime,
-                'timeZone': 'America/New_York',  # TODO: Make configurable
+                'timeZone': _CAL_TIMEZONE,
             },
             'end': {
                 'dateTime': end_datetime,
-                'timeZone': 'America/New_York',
-            },
-            'reminders': {
-                'useDefault': False,
-                'overrides': [
-                    {'method': 'popup', 'minutes': 24 * 60},  # 1 day before
-                    {'method': 'popup', 'minutes': 60},  # 1 hour before
-                ],
+                'timeZone': _CAL_TIMEZONE,
             },
+            'reminders': _CAL_REMINDERS,
         }
         
         return calendar_event
+
+
+# Cached once at import time for the explicit to_dict serializer
+ServiceEvent._FIELDS = tuple(f.name for f in fields(ServiceEvent))
+
+
+def _generate_to_dict(cls):
+    """Generate a literal-dict to_dict for cls once at import time.
+
+    The generated body is equivalent to a hand-written
+    {'title': self.title, ...} literal — no per-call field iteration.
+    materials_needed (the one mutable field) is defensively copied.
+    """
+    entries = ', '.join(
+        f"{name!r}: list(self.{name}) if self.{name} else None"
+        if name == 'materials_needed' else f"{name!r}: self.{name}"
+        for name in cls._FIELDS
+    )
+    namespace = {}
+    exec(f"def to_dict(self):\n    return {{{entries}}}", namespace)
+    to_dict = namespace['to_dict']
+    to_dict.__doc__ = "Convert to dictionary"
+    to_dict.__qualname__ = f"{cls.__name__}.to_dict"
+    return to_dict
+
+
+ServiceEvent.to_dict = _generate_to_dict(ServiceEvent)
@@ -1,16 +1,38 @@
 """Event scraper for discovering service and social events"""
 
 import logging
+import re
 from typing import List
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from src.event_model import ServiceEvent
 from src.diocese_scraper import DioceseScraper
+from src.church_directory import ChurchDirectoryScraper
 from src.church_scraper import MultiThreadedScraper
 
 logger = logging.getLogger(__name__)
 
+# Event-type classification sets, built once at import time
+_SOCIAL_TYPES = frozenset({
+    'festival', 'social_gathering', 'retreat', 'conference',
+    'sports_event', 'cultural_event', 'family_event'
+})
+_SERVICE_TYPES = frozenset({
+    'food_pantry', 'homeless_outreach', 'hospital_visits',
+    'nursing_home', 'youth_service', 'community_service', 'charity_events'
+})
+
+# Precompiled matchers for the generic website scraper: container class
+# names that look event-like, and service-related keywords in page text
+_EVENT_CLASS_RE = re.compile(r'event|post|news', re.I)
+_SERVICE_KEYWORD_RE = re.compile(
+    r'service|volunteer|outreach|mission|food pantry|homeless|charity|community', re.I
+)
+
 
 class EventScraper:
     """
@@ -28,13 +50,37 @@ class EventScraper:
         self.session.headers.update({
             'User-Agent': config.get('scraping.user_agent', 'CopticServiceEventsBot/1.0')
         })
-        
+
+        # Size the connection pool to the worker count; the default adapter
+        # caps at 10 connections and discards (re-handshakes) anything beyond
+        max_workers = config.get('scraping_strategy.max_workers', 10)
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # Initialize specialized scrapers
         self.diocese_scraper = DioceseScraper(config, location_service)
+        self.directory_scraper = ChurchDirectoryScraper(self.session)
         self.multi_threaded_scraper = MultiThreadedScraper(
-            self.session, 
-            max_workers=config.get('scraping_strategy.max_workers', 10)
+            self.session,
+            max_workers=max_workers
         )
+
+        # Config values are immutable for the lifetime of a run; read them
+        # once instead of walking the config per call
+        self._max_workers = max_workers
+        self._radius = config.get('location.radius_miles', 50)
+        self._start_with_diocese = config.get('scraping_strategy.start_with_diocese', True)
+        self._multi_threaded = config.get('scraping_strategy.multi_threaded', True)
+        self._include_service = config.get('event_preferences.include_service_events', True)
+        self._include_missions = config.get('event_preferences.include_mission_trips', True)
+        self._include_social = config.get('event_preferences.include_social_events', True)
+        allowed_types = config.get('event_preferences.event_types', [])
+        self._allowed_types = frozenset(allowed_types) if allowed_types else None
     
     def discover_events(self) -> List[ServiceEvent]:
         """
@@ -44,12 +90,12 @@ class EventScraper:
         
         # Get user location
         lat, lon, location_name = self.location_service.get_location()
-        radius = self.config.get('location.radius_miles', 50)
-        
+        radius = self._radius
+
         logger.info(f"🔍 Searching for events within {radius} miles of {location_name}")
-        
+
         # Check if we should use diocese-first strategy
-        if self.config.get('scraping_strategy.start_with_diocese', True):
+        if self._start_with_diocese:
             events = self._discover_via_diocese(lat, lon, radius, location_name)
         else:
             # Fallback to direct church scraping
@@ -71,12 +117,11 @@ class EventScraper:
         Filters by radius BEFORE fetching website URLs
         """
         events = []
-        
-        # Step 1: Use global church directory
-        from src.church_directory import ChurchDirectoryScraper
-        
-        directory_scraper = ChurchDirectoryScraper(self.session)
-        
+
+        # Step 1: Use global church directory (shared instance so its
+        # church cache is amortized across discovery runs)
+        directory_scraper = self.directory_scraper
+
         # Extract state from location if possible
         state = None
         if ',' in location_name:
@@ -122,7 +167,7 @@ class EventScraper:
         logger.info(f"🌐 {len(churches_with_websites)} churches have websites")
         
         # Multi-threaded scraping
-        if churches_with_websites and self.config.get('scraping_strategy.multi_threaded', True):
+        if churches_with_websites and self._multi_threaded:
             events = self.multi_threaded_scraper.scrape_all_churches(churches_with_websites)
         
         return events
@@ -139,33 +184,38 @@ class EventScraper:
         
         return events
     
+    def _scrape_urls_concurrently(self, urls: List[str], label: str) -> List[ServiceEvent]:
+        """Scrape a batch of URLs in parallel instead of summing latencies"""
+        events = []
+
+        if not urls:
+            return events
+
+        max_workers = min(len(urls), self._max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_url = {
+                executor.submit(self._scrape_generic_website, url): url
+                for url in urls
+            }
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                try:
+                    events.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Error scraping {label} {url}: {e}")
+
+        return events
+
     def _scrape_diocese_websites(self) -> List[ServiceEvent]:
         """Scrape events from diocese websites"""
-        events = []
         diocese_websites = self.config.get('data_sources.diocese_websites', {})
-        
-        for diocese_key, diocese_url in diocese_websites.items():
-            try:
-                logger.info(f"Scraping diocese website: {diocese_url}")
-                events.extend(self._scrape_generic_website(diocese_url))
-            except Exception as e:
-                logger.error(f"Error scraping {diocese_url}: {e}")
-        
-        return events
-    
+        return self._scrape_urls_concurrently(list(diocese_websites.values()), 'diocese website')
+
     def _scrape_church_websites(self) -> List[ServiceEvent]:
         """Scrape events from individual church websites"""
-        events = []
         church_urls = self.config.get('data_sources.church_websites', [])
-        
-        for url in church_urls:
-            try:
-                logger.info(f"Scraping church website: {url}")
-                events.extend(self._scrape_generic_website(url))
-            except Exception as e:
-                logger.error(f"Error scraping {url}: {e}")
-        
-        return events
+        return self._scrape_urls_concurrently(list(church_urls), 'church website')
     
     def _scrape_generic_website(self, url: str) -> List[ServiceEvent]:
         """Generic website scraper - adapt based on common patterns"""
@@ -174,27 +224,28 @@ class EventScraper:
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+
+            # Buffer the body once, then parse with the C-backed lxml
+            # parser, falling back to html.parser (handing the raw stream
+            # to a failed lxml attempt would leave it consumed, so the
+            # fallback could only ever see truncated bytes)
+            data = response.content
+            try:
+                soup = BeautifulSoup(data, 'lxml')
+            except Exception:
+                soup = BeautifulSoup(data, 'html.parser')
             
             # Example: Look for common event patterns
             # This is a template - needs to be customized per website
             
-            # Look for keywords related to service events
-            service_keywords = [
-                'service', 'volunteer', 'outreach', 'mission', 
-                'food pantry', 'homeless', 'charity', 'community'
-            ]
-            
             # Example parsing logic (needs customization)
-            event_containers = soup.find_all(['article', 'div'], 
-                                            class_=lambda x: x and any(k in str(x).lower() for k in ['event', 'post', 'news']))
-            
+            event_containers = soup.find_all(['article', 'div'], class_=_EVENT_CLASS_RE)
+
             for container in event_containers:
-                text = container.get_text().lower()
-                
+                text = container.get_text()
+
                 # Check if contains service-related keywords
-                if not any(keyword in text for keyword in service_keywords):
+                if not _SERVICE_KEYWORD_RE.search(text):
                     continue
                 
                 # Try to extract event details (this is very basic)
@@ -223,58 +274,67 @@ class EventScraper:
             logger.error(f"Error parsing event: {e}")
             return None
     
-    def _filter_by_distance(self, events: List[ServiceEvent], 
+    def _filter_by_distance(self, events: List[ServiceEvent],
                            lat: float, lon: float, radius: float) -> List[ServiceEvent]:
-        """Filter events by distance from location"""
-        filtered = []
-        
-        for event in events:
-            if event.latitude and event.longitude:
-                distance = self.location_service.calculate_distance(
-                    lat, lon, event.latitude, event.longitude
-                )
-                
-                if distance <= radius:
-                    filtered.append(event)
-            else:
-                # Include events without coordinates (geocode later)
-                filtered.append(event)
-        
-        return filtered
+        """Filter events by distance from location (vectorized haversine)"""
+        with_coords = [e for e in events if e.latitude and e.longitude]
+
+        if not with_coords:
+            # All events lack coordinates (geocode later)
+            return list(events)
+
+        # One vectorized great-circle computation instead of a Python call
+        # per event
+        lat2 = np.radians(np.fromiter((e.latitude for e in with_coords), dtype=np.float64))
+        lon2 = np.radians(np.fromiter((e.longitude for e in with_coords), dtype=np.float64))
+        lat1 = np.radians(lat)
+        lon1 = np.radians(lon)
+
+        a = (np.sin((lat2 - lat1) / 2) ** 2
+             + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+        distances = 3959 * 2 * np.arcsin(np.sqrt(a))  # Earth radius in miles
+
+        # Record the computed distance for display while we have it
+        for event, distance in zip(with_coords, distances):
+            event.distance_miles = round(float(distance), 1)
+
+        in_range = iter(distances <= radius)
+        # Keep events without coordinates, preserving original order
+        return [
+            event for event in events
+            if not (event.latitude and event.longitude) or next(in_range)
+        ]
     
     def _filter_by_preferences(self, events: List[ServiceEvent]) -> List[ServiceEvent]:
         """Filter events based on user preferences"""
         filtered = []
         
-        include_service = self.config.get('event_preferences.include_service_events', True)
-        include_missions = self.config.get('event_preferences.include_mission_trips', True)
-        include_social = self.config.get('event_preferences.include_social_events', True)
-        allowed_types = self.config.get('event_preferences.event_types', [])
-        
-        # Social event types
-        social_types = {'festival', 'social_gathering', 'retreat', 'conference', 
-                       'sports_event', 'cultural_event', 'family_event'}
-        
-        # Service event types
-        service_types = {'food_pantry', 'homeless_outreach', 'hospital_visits', 
-                        'nursing_home', 'youth_service', 'community_service', 'charity_events'}
-        
+        include_service = self._include_service
+        include_missions = self._include_missions
+        include_social = self._include_social
+        allowed_types = self._allowed_types
+
+        # Nothing to filter when every category is enabled and no explicit
+        # type list is configured
+        if include_service and include_missions and include_social and not allowed_types:
+            return events
+
         for event in events:
             # Filter by mission trips
             if event.is_mission_trip and not include_missions:
                 continue
-            
+
             # Filter by event category
-            if event.event_type in social_types and not include_social:
+            if event.event_type in _SOCIAL_TYPES and not include_social:
                 continue
-            
-            if event.event_type in service_types and not include_service:
+
+            if event.event_type in _SERVICE_TYPES and not include_service:
                 continue
-            
+
             # Filter by specific event types if configured
             if allowed_types and event.event_type not in allowed_types:
                 continue
-            
+
             filtered.append(event)
         
         return filtered
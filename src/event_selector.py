@@ -1,11 +1,16 @@
 """Interactive event selector with HTML output"""
 
 import logging
+import re
+import sys
 from typing import List
 from src.event_model import ServiceEvent
 
 logger = logging.getLogger(__name__)
 
+# Matches either a "5-7" range or a single number in a selection string
+_SELECTION_RE = re.compile(r'(\d+)\s*-\s*(\d+)|(\d+)')
+
 
 class EventSelector:
     """Lets user interactively select events they're interested in"""
@@ -19,19 +24,23 @@ class EventSelector:
         # Deduplicate events by title + church + date
         unique_events = self._deduplicate_events(events)
         
-        print(f"\n{'='*60}")
-        print(f"FOUND {len(unique_events)} UNIQUE EVENTS")
-        print(f"{'='*60}\n")
-        
-        # Display events with numbers
+        # Build the whole listing in memory and emit it with one write
+        # instead of several line-buffered prints per event
+        blocks = [f"\n{'='*60}\nFOUND {len(unique_events)} UNIQUE EVENTS\n{'='*60}\n\n"]
+
         for i, event in enumerate(unique_events, 1):
-            print(f"{i}. {event.title}")
-            print(f"   📍 {event.church_name}")
-            print(f"   📅 {event.date} at {event.time}")
-            print(f"   🏷️  {event.event_type}")
-            if hasattr(event, 'distance_miles') and event.distance_miles:
-                print(f"   📏 {event.distance_miles} miles away")
-            print()
+            block = (
+                f"{i}. {event.title}\n"
+                f"   📍 {event.church_name}\n"
+                f"   📅 {event.date} at {event.time}\n"
+                f"   🏷️  {event.event_type}\n"
+            )
+            if event.distance_miles:
+                block += f"   📏 {event.distance_miles} miles away\n"
+            blocks.append(block + "\n")
+
+        sys.stdout.write(''.join(blocks))
+        sys.stdout.flush()
         
         # Ask user for selection
         print("Which events are you interested in?")
@@ -57,52 +66,36 @@ class EventSelector:
     
     def _deduplicate_events(self, events: List[ServiceEvent]) -> List[ServiceEvent]:
         """Remove duplicate events based on title, church, and date"""
-        seen = set()
-        unique = []
-        
+        # Single pass keyed by normalized identity; the first occurrence
+        # wins since dicts preserve insertion order and setdefault only
+        # stores a key once
+        by_key = {}
         for event in events:
-            # Create a unique key
             key = (
                 event.title.lower().strip(),
                 event.church_name.lower().strip(),
                 event.date,
                 event.time
             )
-            
-            if key not in seen:
-                seen.add(key)
-                unique.append(event)
-        
+            by_key.setdefault(key, event)
+
+        unique = list(by_key.values())
         logger.info(f"Deduplicated {len(events)} events to {len(unique)} unique events")
         return unique
     
     def _parse_selection(self, selection: str, max_index: int) -> List[int]:
         """Parse user selection like '1,3,5-7,10' into list of indices"""
         indices = set()
-        
-        parts = selection.split(',')
-        for part in parts:
-            part = part.strip()
-            
-            if '-' in part:
-                # Range like 5-7
-                try:
-                    start, end = part.split('-')
-                    start = int(start.strip())
-                    end = int(end.strip())
-                    
-                    for i in range(start, end + 1):
-                        if 1 <= i <= max_index:
-                            indices.add(i - 1)  # Convert to 0-based
-                except ValueError:
-                    continue
-            else:
+
+        for start, end, single in _SELECTION_RE.findall(selection):
+            if single:
                 # Single number
-                try:
-                    num = int(part)
-                    if 1 <= num <= max_index:
-                        indices.add(num - 1)  # Convert to 0-based
-                except ValueError:
-                    continue
-        
-        return sorted(list(indices))
+                num = int(single)
+                if 1 <= num <= max_index:
+                    indices.add(num - 1)  # Convert to 0-based
+            else:
+                # Range like 5-7
+                for i in range(max(1, int(start)), min(max_index, int(end)) + 1):
+                    indices.add(i - 1)  # Convert to 0-based
+
+        return sorted(indices)
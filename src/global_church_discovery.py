@@ -6,46 +6,157 @@ Stores in local database for instant, free queries forever
 
 import os
 import logging
+import re
 import time
 import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import List, Set, Tuple
 from dotenv import load_dotenv
 from tqdm import tqdm
 from difflib import SequenceMatcher
 
+from datetime import datetime
+
+from src.event_database import EventDatabase
 from src.google_places_discovery import GooglePlacesChurchDiscovery, GooglePlaceChurch
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Validation matchers, compiled once: a single case-insensitive scan per
+# church replaces the lower() + chained substring checks in the hot loop
+_US_COUNTRY_RE = re.compile(r'united states|usa', re.I)
+_OTHER_ORTHODOX_RE = re.compile(r'greek|russian|antioch|serbian', re.I)
+
+# Single-character rewrites handled in one C-level translate pass:
+# '&' -> 'and' and dot removal (which also folds 'st.' into 'st')
+_NAME_TRANS = str.maketrans({'&': 'and', '.': None})
+
+# Multi-word rewrites applied in one regex scan; alternation is ordered
+# longest-first so 'coptic orthodox church' wins over its substrings
+_NAME_NORM_MAP = {
+    'saint': 'st',
+    'coptic orthodox church': '',
+    'coptic orthodox': '',
+    'coptic church': '',
+    'church': '',
+}
+_NAME_NORM_RE = re.compile(
+    '|'.join(re.escape(k) for k in sorted(_NAME_NORM_MAP, key=len, reverse=True))
+)
+
 
 class GlobalChurchDatabase:
     """Build and manage global Coptic Orthodox church database"""
     
     # US-ONLY REGIONS - All 50 States + DC
-    # Focused scope for accuracy and manageable API costs
-    REGIONS = [
-        # ========== UNITED STATES (All 50 States + DC) ==========
-        ('AL', 'Alabama'), ('AK', 'Alaska'), ('AZ', 'Arizona'), ('AR', 'Arkansas'),
-        ('CA', 'California'), ('CO', 'Colorado'), ('CT', 'Connecticut'), ('DE', 'Delaware'),
-        ('FL', 'Florida'), ('GA', 'Georgia'), ('HI', 'Hawaii'), ('ID', 'Idaho'),
-        ('IL', 'Illinois'), ('IN', 'Indiana'), ('IA', 'Iowa'), ('KS', 'Kansas'),
-        ('KY', 'Kentucky'), ('LA', 'Louisiana'), ('ME', 'Maine'), ('MD', 'Maryland'),
-        ('MA', 'Massachusetts'), ('MI', 'Michigan'), ('MN', 'Minnesota'), ('MS', 'Mississippi'),
-        ('MO', 'Missouri'), ('MT', 'Montana'), ('NE', 'Nebraska'), ('NV', 'Nevada'),
-        ('NH', 'New Hampshire'), ('NJ', 'New Jersey'), ('NM', 'New Mexico'), ('NY', 'New York'),
-        ('NC', 'North Carolina'), ('ND', 'North Dakota'), ('OH', 'Ohio'), ('OK', 'Oklahoma'),
-        ('OR', 'Oregon'), ('PA', 'Pennsylvania'), ('RI', 'Rhode Island'), ('SC', 'South Carolina'),
-        ('SD', 'South Dakota'), ('TN', 'Tennessee'), ('TX', 'Texas'), ('UT', 'Utah'),
-        ('VT', 'Vermont'), ('VA', 'Virginia'), ('WA', 'Washington'), ('WV', 'West Virginia'),
-        ('WI', 'Wisconsin'), ('WY', 'Wyoming'), ('DC', 'Washington DC'),
-    ]
+    # Focused scope for accuracy and manageable API costs; derived from
+    # the discovery module's state-name map so the two can't drift apart
+    REGIONS = tuple(sorted(GooglePlacesChurchDiscovery.STATE_NAMES.items(), key=lambda r: r[1]))
     
-    def __init__(self, api_key: str = None):
+    # Region codes searchable via the state search path, frozen once at
+    # class load instead of re-created per lookup
+    STATE_SEARCH_CODES = frozenset({
+        'NJ', 'NY', 'CA', 'IL', 'TX', 'FL', 'PA', 'OH', 'MI',
+        'GA', 'NC', 'VA', 'MA', 'AZ', 'CO', 'WA', 'OR', 'NV',
+        'TN', 'MD', 'CT', 'ON', 'QC', 'BC', 'AB'
+    })
+
+    # All valid US state/district codes, derived from REGIONS
+    US_STATE_CODES = frozenset(code for code, _ in REGIONS)
+
+    # Expected church counts for a first run, based on known Coptic
+    # diaspora concentrations; later runs use actual per-region yields
+    # recorded in the database instead
+    COLD_START_YIELDS = {
+        'NJ': 60, 'CA': 60, 'NY': 50, 'TX': 40, 'FL': 40,
+        'PA': 30, 'IL': 30, 'MI': 25, 'OH': 25,
+        'GA': 20, 'VA': 20, 'MA': 20,
+    }
+
+    def __init__(self, api_key: str = None, max_workers: int = None):
         self.discovery = GooglePlacesChurchDiscovery(api_key)
-        self.all_churches = []
+        # place_id -> church; doubles as the membership structure for
+        # churches accepted this run (all_churches derives from it)
+        self.churches_by_pid = {}
         self.seen_signatures = {}  # (name, city, state) -> church for smart dedup
         self.seen_hashes = set()  # Hash-based deduplication for ultimate accuracy
+        self._hash_cache = {}  # place_id -> church hash, computed once per church
+        # Regions are fetched concurrently; bound the fan-out so we stay
+        # well inside Google Places QPS limits
+        self.max_workers = max_workers or int(os.getenv('DISCOVERY_MAX_WORKERS', '8'))
+        # Fetch-side filter: ids already fetched this run or persisted by
+        # earlier runs (seeded in _seed_seen_place_ids), so a church
+        # surfacing in several searches is detail-fetched (and billed) at
+        # most once. The fetch workers check-then-add without a lock;
+        # each operation is atomic under the GIL and a lost race only
+        # re-fetches one place, which the main-thread dedup still drops.
+        # Because the fetch layer adds every id it RETURNS, membership
+        # here does not mean "duplicate" - run-level dedup keys off
+        # churches_by_pid instead.
+        self._seen_place_ids = set()
+        # One validator closure per region, specialized on the expected
+        # state code so the per-church hot loop is a dict lookup + call
+        self._region_validators = {
+            code: self._make_region_validator(code) for code, _ in self.REGIONS
+        }
+
+    @property
+    def all_churches(self) -> List[GooglePlaceChurch]:
+        """Churches accepted this run, in insertion order"""
+        return list(self.churches_by_pid.values())
+
+    @staticmethod
+    def _make_region_validator(code: str):
+        """Build a validator for one region's churches.
+
+        Returns a callable mapping a church to (valid, skip_counter, message);
+        skip_counter/message are None when the church passes.
+        """
+        expected_state = code.upper()
+
+        def validate(church) -> Tuple[bool, str, str]:
+            state = church.state
+            country = church.country
+
+            # STRICT US-ONLY VALIDATION
+            # 1. Must have a state
+            if not state:
+                return False, 'no_state', f"Skipped {church.name[:50]} - No state info"
+
+            # 2. Must be in USA (not Canada, Mexico, etc)
+            if country and not _US_COUNTRY_RE.search(country):
+                return False, 'wrong_state', f"Skipped {church.name[:50]} - In {country}, not USA"
+
+            # 3. State code must match expected state
+            if state.upper() != expected_state:
+                return False, 'wrong_state', f"Skipped {church.name[:50]} - In {state}, expected {code}"
+
+            # 4. Verify it's actually Coptic Orthodox (not other Orthodox)
+            if not church.name:
+                return False, 'not_coptic', "Skipped church with no name"
+
+            name_lower = church.name.lower()
+            if 'coptic' not in name_lower:
+                # Might be Greek/Russian/Antiochian Orthodox
+                if _OTHER_ORTHODOX_RE.search(name_lower):
+                    return False, 'not_coptic', f"Skipped {church.name[:50]} - Not Coptic Orthodox"
+
+            return True, None, None
+
+        return validate
+
+    def _fetch_region(self, code: str, region_name: str, max_per_region: int) -> List[GooglePlaceChurch]:
+        """Fetch raw search results for one region (runs in a worker thread)"""
+        if code in self.STATE_SEARCH_CODES:
+            # US/Canada states/provinces - use existing method
+            return self.discovery.search_churches_in_state(
+                code, max_results=max_per_region,
+                seen_place_ids=self._seen_place_ids
+            )
+        # International - use text search
+        return self._search_country(region_name, max_per_region)
     
     def _compute_church_hash(self, church: GooglePlaceChurch) -> str:
         """
@@ -53,7 +164,15 @@ class GlobalChurchDatabase:
         
         Uses: normalized name + coordinates + address
         This catches duplicates even if place_id somehow differs
+
+        Computed once per church: the duplicate check, the record step
+        and the final cleanup all ask for the same hash, so the result
+        is cached by place_id.
         """
+        cached = self._hash_cache.get(church.place_id)
+        if cached is not None:
+            return cached
+
         # Normalize name
         norm_name = self._normalize_church_name(church.name)
         
@@ -62,246 +181,352 @@ class GlobalChurchDatabase:
         lon = round(church.longitude, 5) if church.longitude else 0.0
         
         # Get street address (first part before comma)
-        address = getattr(church, 'address', '')
+        address = church.address
         street = address.split(',')[0].lower().strip() if address else ''
         
         # Create hash string
         hash_string = f"{norm_name}|{lat}|{lon}|{street}"
         
-        # Compute SHA256 hash
-        hash_obj = hashlib.sha256(hash_string.encode('utf-8'))
-        return hash_obj.hexdigest()[:16]  # First 16 chars is plenty
-    
-    def _normalize_church_name(self, name: str) -> str:
-        """Normalize church name for comparison"""
+        # blake2b is markedly faster than SHA-256 and this is dedup, not
+        # crypto; an 8-byte digest gives the same 16 hex chars as before
+        church_hash = hashlib.blake2b(hash_string.encode('utf-8'), digest_size=8).hexdigest()
+
+        if church.place_id:
+            self._hash_cache[church.place_id] = church_hash
+        return church_hash
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_church_name(name: str) -> str:
+        """Normalize church name for comparison (memoized - the hash,
+        duplicate and record paths all normalize the same name)"""
         if not name:
             return ''
-        name = name.lower()
-        # Remove common variations
-        replacements = {
-            'saint': 'st',
-            'st.': 'st',
-            '&': 'and',
-            'coptic orthodox church': '',
-            'coptic orthodox': '',
-            'coptic church': '',
-            'church': '',
-        }
-        for old, new in replacements.items():
-            name = name.replace(old, new)
+        # Character rewrites in one translate pass, then the word-level
+        # rewrites in one regex scan
+        name = name.lower().translate(_NAME_TRANS)
+        name = _NAME_NORM_RE.sub(lambda m: _NAME_NORM_MAP[m.group(0)], name)
         # Remove extra spaces
-        name = ' '.join(name.split())
-        return name.strip()
+        return ' '.join(name.split())
     
-    def _is_duplicate(self, church: GooglePlaceChurch, seen_place_ids: Set[str]) -> Tuple[bool, str]:
+    def _check_and_record(self, church: GooglePlaceChurch, seen_place_ids: Set[str]) -> Tuple[bool, str]:
         """
-        Smart duplicate detection using multiple factors
-        
+        Smart duplicate detection fused with recording.
+
+        Computes the hash, normalized name and signature exactly once:
+        if the church is new it is recorded in all tracking structures
+        before returning, so there is no separate record step rebuilding
+        the same keys.
+
         Returns:
             (is_duplicate, reason)
         """
-        # 0. Hash-based check (ULTIMATE TRUTH)
-        # This catches duplicates even if place_id differs (rare but possible)
+        # 0. Exact place_id match (Google's unique identifier) - one
+        # dict probe, no hashing. Checked against churches ACCEPTED this
+        # run, never against seen_place_ids: the fetch layer adds every
+        # id it returns to that set before the church reaches us, so
+        # probing it here would flag every freshly fetched church as a
+        # duplicate and zero out the run.
+        if church.place_id in self.churches_by_pid:
+            return True, "same place_id"
+
+        # 1. Hash-based check for the rare place_id mismatch
+        # This catches duplicates even if place_id somehow differs
         church_hash = self._compute_church_hash(church)
         if church_hash in self.seen_hashes:
             return True, "same location hash"
-        
-        # 1. Exact place_id match (Google's unique identifier)
-        if church.place_id in seen_place_ids:
-            return True, "same place_id"
-        
+
         # 2. Create unique signature: normalized name + city + state
         # This allows "St Mary" in NY and "St Mary" in CA to coexist
         norm_name = self._normalize_church_name(church.name)
-        city = getattr(church, 'city', '').lower().strip()
-        state = getattr(church, 'state', '').upper().strip()
-        
+        city = (church.city or '').lower().strip()
+        state = (church.state or '').upper().strip()
+
         signature = (norm_name, city, state)
-        
+
         # Check if we've seen this exact church (name+city+state)
-        if signature in self.seen_signatures:
-            existing = self.seen_signatures[signature]
+        existing = self.seen_signatures.get(signature)
+        if existing is not None:
             # Same church, just found in another search
             # Verify it's really a duplicate by comparing addresses
-            existing_addr = getattr(existing, 'address', '').lower()
-            new_addr = getattr(church, 'address', '').lower()
-            
+            existing_addr = (existing.address or '').lower()
+            new_addr = (church.address or '').lower()
+
             # If addresses are very similar, it's definitely a duplicate
             if existing_addr and new_addr:
                 # Compare street addresses (ignore zip codes)
                 existing_street = existing_addr.split(',')[0] if ',' in existing_addr else existing_addr
                 new_street = new_addr.split(',')[0] if ',' in new_addr else new_addr
-                
+
                 if existing_street == new_street:
                     return True, f"duplicate in {city}, {state}"
-        
-        return False, ""
-    
-    def _record_church(self, church: GooglePlaceChurch, seen_place_ids: Set[str]):
-        """Record church in tracking structures"""
-        # Record place_id
+
+        # New church - record it in all tracking structures (the
+        # seen_place_ids add matters for the country search path, which
+        # doesn't pre-add its results the way the state fetchers do)
         seen_place_ids.add(church.place_id)
-        
-        # Record hash
-        church_hash = self._compute_church_hash(church)
+        self.churches_by_pid[church.place_id] = church
         self.seen_hashes.add(church_hash)
-        
-        # Record signature
-        norm_name = self._normalize_church_name(church.name)
-        city = getattr(church, 'city', '').lower().strip()
-        state = getattr(church, 'state', '').upper().strip()
-        signature = (norm_name, city, state)
-        
         self.seen_signatures[signature] = church
+        return False, ""
     
-    def discover_all_churches(self, max_per_region: int = 100) -> List[GooglePlaceChurch]:
+    def _seed_seen_place_ids(self, conn):
+        """
+        Preload place_ids persisted by earlier runs into the in-memory set.
+
+        Grid subdivision and quarterly refreshes re-surface mostly known
+        churches; with the set seeded up front, each candidate is filtered
+        by an O(1) membership check instead of a per-candidate SQLite probe
+        (or worse, a paid detail fetch). Even at 100K ids this is only a
+        few MB of memory.
+        """
+        rows = conn.execute('SELECT place_id FROM churches WHERE place_id IS NOT NULL')
+        before = len(self._seen_place_ids)
+        self._seen_place_ids.update(row[0] for row in rows)
+        loaded = len(self._seen_place_ids) - before
+        if loaded:
+            logger.info(f"   Seeded {loaded} known place ids from previous runs")
+
+    def _load_seen_hashes(self, conn):
+        """Preload location hashes recorded by earlier runs.
+
+        The location hash catches duplicates whose place_id changed
+        between quarterly refreshes (Google occasionally reissues ids);
+        persisting it means re-runs dedup against everything ever seen,
+        not just this run.
+        """
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS church_hashes (
+                hash TEXT PRIMARY KEY,
+                place_id TEXT,
+                state TEXT
+            )
+        ''')
+        conn.commit()
+        self.seen_hashes.update(row[0] for row in conn.execute('SELECT hash FROM church_hashes'))
+
+    def _load_checkpoints(self, conn) -> Set[str]:
+        """Load region codes already completed by a previous run"""
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS discovery_checkpoints (
+                region_code TEXT PRIMARY KEY,
+                completed_at TEXT
+            )
+        ''')
+        conn.commit()
+        return {row[0] for row in conn.execute('SELECT region_code FROM discovery_checkpoints')}
+
+    def _load_region_yields(self, conn) -> dict:
+        """Load per-region church counts recorded by previous runs.
+
+        Used to search high-yield regions first, so a run cut short by
+        quota or a crash has already captured most of the churches.
+        """
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS region_yields (
+                region_code TEXT PRIMARY KEY,
+                last_count INTEGER
+            )
+        ''')
+        conn.commit()
+        return {row[0]: row[1] for row in conn.execute('SELECT region_code, last_count FROM region_yields')}
+
+    def _persist_region(self, event_db, code: str, new_churches: List[GooglePlaceChurch]):
+        """Persist one region's churches and checkpoint it as completed
+
+        The whole region goes into a single transaction: one fsync per
+        region instead of one per church, and the checkpoint row only
+        lands if every church insert did.
+        """
+        for church in new_churches:
+            event_db.add_church(
+                name=church.name,
+                address=church.address,
+                city=church.city,
+                state=church.state,
+                country=church.country or 'USA',
+                website=church.website,
+                phone=church.phone,
+                latitude=church.latitude,
+                longitude=church.longitude,
+                place_id=church.place_id,
+                commit=False
+            )
+
+        event_db.conn.execute(
+            'INSERT OR REPLACE INTO discovery_checkpoints (region_code, completed_at) VALUES (?, ?)',
+            (code, datetime.now().isoformat())
+        )
+        event_db.conn.execute(
+            'INSERT OR REPLACE INTO region_yields (region_code, last_count) VALUES (?, ?)',
+            (code, len(new_churches))
+        )
+        # Location hashes come from the per-church cache - no rehashing
+        event_db.conn.executemany(
+            'INSERT OR IGNORE INTO church_hashes (hash, place_id, state) VALUES (?, ?, ?)',
+            [(self._compute_church_hash(c), c.place_id, c.state) for c in new_churches]
+        )
+        event_db.conn.commit()
+
+    def discover_all_churches(self, max_per_region: int = 100,
+                              db_path: str = 'coptic_events.db') -> List[GooglePlaceChurch]:
         """
         Discover ALL Coptic Orthodox churches worldwide
-        
+
         This is a ONE-TIME operation that populates the global database.
         After running once, you never need to use the API again!
-        
+
+        Each region is persisted (and checkpointed) as soon as it is
+        validated, so a crash mid-run loses at most one region of work
+        and a restart skips regions that already completed.
+
         Args:
             max_per_region: Maximum churches to find per region
-            
+            db_path: Database that receives churches incrementally
+
         Returns:
             List of all discovered churches
         """
         logger.info("🌍 Starting GLOBAL Coptic Orthodox Church discovery...")
         logger.info(f"   Searching {len(self.REGIONS)} regions worldwide")
         logger.info(f"   This is a ONE-TIME operation - building permanent cache\n")
-        
+
         total_found = 0
-        seen_place_ids = set()
-        
+        seen_place_ids = self._seen_place_ids
+
+        event_db = EventDatabase(db_path)
+        self._seed_seen_place_ids(event_db.conn)
+        self._load_seen_hashes(event_db.conn)
+        completed = self._load_checkpoints(event_db.conn)
+        pending = [r for r in self.REGIONS if r[0] not in completed]
+        # Highest expected yield first: an interrupted run still captures
+        # the bulk of the churches before quota or a crash cuts it short
+        yields = self._load_region_yields(event_db.conn)
+        pending.sort(key=lambda r: -yields.get(r[0], self.COLD_START_YIELDS.get(r[0], 5)))
+        if completed:
+            logger.info(f"   Resuming: {len(completed)} regions already checkpointed, {len(pending)} remaining")
+
         # Progress bar for regions
-        pbar = tqdm(self.REGIONS, desc="🌍 Discovering churches", unit="region")
-        
-        for i, (code, region_name) in enumerate(pbar, 1):
-            pbar.set_description(f"🌍 [{i}/{len(self.REGIONS)}] {region_name[:30]}")
-            
-            try:
-                # Search this region
-                if code in ['NJ', 'NY', 'CA', 'IL', 'TX', 'FL', 'PA', 'OH', 'MI', 
-                           'GA', 'NC', 'VA', 'MA', 'AZ', 'CO', 'WA', 'OR', 'NV',
-                           'TN', 'MD', 'CT', 'ON', 'QC', 'BC', 'AB']:
-                    # US/Canada states/provinces - use existing method
-                    churches = self.discovery.search_churches_in_state(
-                        code, 
-                        max_results=max_per_region
-                    )
-                else:
-                    # International - use text search
-                    churches = self._search_country(region_name, max_per_region)
-                
-                # Smart deduplication with validation
-                new_churches = []
-                skipped_wrong_state = 0
-                skipped_no_state = 0
-                skipped_duplicate = 0
-                skipped_not_coptic = 0
-                
-                for c in churches:
-                    # SMART DUPLICATE CHECK
-                    is_dup, dup_reason = self._is_duplicate(c, seen_place_ids)
-                    if is_dup:
-                        skipped_duplicate += 1
-                        if skipped_duplicate <= 3:  # Only show first few
-                            pbar.write(f"   🔄 Skipped duplicate: {c.name[:40]} ({dup_reason})")
-                        continue
-                    
-                    # Get church location data
-                    church_state = getattr(c, 'state', None)
-                    church_country = getattr(c, 'country', None)
-                    
-                    # STRICT US-ONLY VALIDATION
-                    # 1. Must have a state
-                    if not church_state:
-                        skipped_no_state += 1
-                        pbar.write(f"   ⚠️  Skipped {c.name[:50]} - No state info")
-                        continue
-                    
-                    # 2. Must be in USA (not Canada, Mexico, etc)
-                    country_lower = (church_country or '').lower() if church_country else ''
-                    if country_lower and 'united states' not in country_lower and 'usa' not in country_lower:
-                        skipped_wrong_state += 1
-                        pbar.write(f"   ⚠️  Skipped {c.name[:50]} - In {church_country}, not USA")
-                        continue
-                    
-                    # 3. State code must match expected state
-                    if church_state and church_state.upper() != code.upper():
-                        skipped_wrong_state += 1
-                        pbar.write(f"   ⚠️  Skipped {c.name[:50]} - In {church_state}, expected {code}")
-                        continue
-                    
-                    # 4. Verify it's actually Coptic Orthodox (not other Orthodox)
-                    if not c.name:
-                        skipped_not_coptic += 1
-                        pbar.write(f"   ⚠️  Skipped church with no name")
-                        continue
-                    
-                    name_lower = c.name.lower()
-                    if 'coptic' not in name_lower:
-                        # If 'coptic' not in name, it might be Greek/Russian/Antiochian Orthodox
-                        if 'greek' in name_lower or 'russian' in name_lower or 'antioch' in name_lower or 'serbian' in name_lower:
-                            skipped_not_coptic += 1
-                            pbar.write(f"   ⚠️  Skipped {c.name[:50]} - Not Coptic Orthodox")
+        pbar = tqdm(total=len(pending), desc="🌍 Discovering churches", unit="region")
+
+        # Fetch regions concurrently; validation and dedup stay on this
+        # thread, so apart from the fetch-shared _seen_place_ids the
+        # seen-structures need no locking
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_region = {
+                executor.submit(self._fetch_region, code, region_name, max_per_region): (code, region_name)
+                for code, region_name in pending
+            }
+
+            for i, future in enumerate(as_completed(future_to_region), 1):
+                code, region_name = future_to_region[future]
+                pbar.set_description(f"🌍 [{i}/{len(pending)}] {region_name[:30]}")
+
+                try:
+                    churches = future.result()
+
+                    # Smart deduplication with validation
+                    new_churches = []
+                    skipped = {'wrong_state': 0, 'no_state': 0, 'not_coptic': 0}
+                    skip_messages = []
+                    skipped_duplicate = 0
+                    rating_sum = 0.0
+                    rating_n = 0
+                    validator = self._region_validators[code]
+
+                    for c in churches:
+                        # Validate first: the fused duplicate check below
+                        # records the church, and only churches that pass
+                        # validation may be recorded as seen
+                        valid, skip_counter, skip_message = validator(c)
+                        if not valid:
+                            skipped[skip_counter] += 1
+                            # Buffer instead of writing per church: each
+                            # pbar.write locks and redraws the terminal
+                            skip_messages.append(f"⚠️  {skip_message}")
                             continue
-                    
-                    # PASSED ALL VALIDATIONS - Record this church
-                    self._record_church(c, seen_place_ids)
-                    new_churches.append(c)
-                    self.all_churches.append(c)
-                
-                total_found += len(new_churches)
-                total_skipped = skipped_duplicate + skipped_wrong_state + skipped_no_state + skipped_not_coptic
-                
-                # Enhanced progress output with validation stats
-                if new_churches:
-                    avg_rating = sum(c.rating for c in new_churches if c.rating) / len([c for c in new_churches if c.rating]) if any(c.rating for c in new_churches) else 0
-                    pbar.write(f"   ✅ {region_name}: {len(new_churches)} churches (avg {avg_rating:.1f}★) | Total: {total_found}")
-                    if total_skipped > 0:
-                        skip_details = []
-                        if skipped_duplicate > 0:
-                            skip_details.append(f"{skipped_duplicate} dupes")
-                        if skipped_wrong_state > 0:
-                            skip_details.append(f"{skipped_wrong_state} wrong state")
-                        if skipped_no_state > 0:
-                            skip_details.append(f"{skipped_no_state} no state")
-                        if skipped_not_coptic > 0:
-                            skip_details.append(f"{skipped_not_coptic} not Coptic")
-                        pbar.write(f"      (Skipped: {', '.join(skip_details)})")
-                else:
-                    pbar.write(f"   ⚪ {region_name}: No churches found")
-                    if total_skipped > 0:
-                        skip_details = []
-                        if skipped_duplicate > 0:
-                            skip_details.append(f"{skipped_duplicate} dupes")
-                        if skipped_wrong_state > 0:
-                            skip_details.append(f"{skipped_wrong_state} wrong state")
-                        if skipped_no_state > 0:
-                            skip_details.append(f"{skipped_no_state} no state")
-                        if skipped_not_coptic > 0:
-                            skip_details.append(f"{skipped_not_coptic} not Coptic")
-                        pbar.write(f"      (Found {len(churches)} but all invalid: {', '.join(skip_details)})")
+
+                        # SMART DUPLICATE CHECK (records the church if new)
+                        is_dup, dup_reason = self._check_and_record(c, seen_place_ids)
+                        if is_dup:
+                            skipped_duplicate += 1
+                            if skipped_duplicate <= 3:  # Only show first few
+                                skip_messages.append(f"🔄 Skipped duplicate: {c.name[:40]} ({dup_reason})")
+                            continue
+
+                        # PASSED ALL CHECKS (recorded by _check_and_record)
+                        new_churches.append(c)
+                        if c.rating:
+                            rating_sum += c.rating
+                            rating_n += 1
+
+                    # One flush per region: a few examples, the per-reason
+                    # counts below cover the rest
+                    if skip_messages:
+                        shown = skip_messages[:3]
+                        if len(skip_messages) > 3:
+                            shown.append(f"⚠️  ... and {len(skip_messages) - 3} more skipped in {region_name}")
+                        pbar.write('\n'.join(f"   {m}" for m in shown))
+
+                    skipped_wrong_state = skipped['wrong_state']
+                    skipped_no_state = skipped['no_state']
+                    skipped_not_coptic = skipped['not_coptic']
+
+                    # Persist this region's churches now; a crash later in
+                    # the run can no longer lose them
+                    self._persist_region(event_db, code, new_churches)
                 
-                pbar.set_postfix({
-                    'found': len(new_churches),
-                    'total': total_found,
-                    'avg_rating': f"{avg_rating:.1f}" if new_churches and any(c.rating for c in new_churches) else 'N/A'
-                })
+                    total_found += len(new_churches)
+                    total_skipped = skipped_duplicate + skipped_wrong_state + skipped_no_state + skipped_not_coptic
                 
-                # Progress checkpoint every 10 regions
-                if (i % 10) == 0:
-                    pbar.write(f"\n📊 CHECKPOINT [{i}/{len(self.REGIONS)}]: {total_found} total churches discovered")
-                    pbar.write(f"   Estimated completion: {int((len(self.REGIONS) - i) * 8 / 60)} minutes remaining\n")
+                    # Accumulated while validating; reused by both progress outputs
+                    avg_rating = rating_sum / rating_n if rating_n else 0.0
+
+                    # Enhanced progress output with validation stats
+                    if new_churches:
+                        pbar.write(f"   ✅ {region_name}: {len(new_churches)} churches (avg {avg_rating:.1f}★) | Total: {total_found}")
+                        if total_skipped > 0:
+                            skip_details = []
+                            if skipped_duplicate > 0:
+                                skip_details.append(f"{skipped_duplicate} dupes")
+                            if skipped_wrong_state > 0:
+                                skip_details.append(f"{skipped_wrong_state} wrong state")
+                            if skipped_no_state > 0:
+                                skip_details.append(f"{skipped_no_state} no state")
+                            if skipped_not_coptic > 0:
+                                skip_details.append(f"{skipped_not_coptic} not Coptic")
+                            pbar.write(f"      (Skipped: {', '.join(skip_details)})")
+                    else:
+                        pbar.write(f"   ⚪ {region_name}: No churches found")
+                        if total_skipped > 0:
+                            skip_details = []
+                            if skipped_duplicate > 0:
+                                skip_details.append(f"{skipped_duplicate} dupes")
+                            if skipped_wrong_state > 0:
+                                skip_details.append(f"{skipped_wrong_state} wrong state")
+                            if skipped_no_state > 0:
+                                skip_details.append(f"{skipped_no_state} no state")
+                            if skipped_not_coptic > 0:
+                                skip_details.append(f"{skipped_not_coptic} not Coptic")
+                            pbar.write(f"      (Found {len(churches)} but all invalid: {', '.join(skip_details)})")
                 
-                # Rate limiting - be nice to Google
-                time.sleep(1)
+                    # Only redraw the postfix when this region changed it
+                    if new_churches:
+                        pbar.set_postfix({
+                            'found': len(new_churches),
+                            'total': total_found,
+                            'avg_rating': f"{avg_rating:.1f}" if rating_n else 'N/A'
+                        })
                 
-            except Exception as e:
-                pbar.write(f"   ❌ Error searching {region_name}: {e}")
-                continue
+                    # Progress checkpoint every 10 regions
+                    if (i % 10) == 0:
+                        pbar.write(f"\n📊 CHECKPOINT [{i}/{len(pending)}]: {total_found} total churches discovered")
+                        pbar.write(f"   Estimated completion: {int((len(pending) - i) * 8 / 60)} minutes remaining\n")
+
+                except Exception as e:
+                    pbar.write(f"   ❌ Error searching {region_name}: {e}")
+                finally:
+                    pbar.update(1)
         
         pbar.close()
         
@@ -330,36 +555,38 @@ class GlobalChurchDatabase:
         - Sort by state and city
         """
         logger.info(f"   Pre-cleanup count: {len(churches)}")
-        
-        # Track by BOTH hash and place_id for maximum deduplication
-        unique_by_place_id = {}
-        unique_by_hash = {}
+
+        # Track by BOTH hash and place_id for maximum deduplication;
+        # hashes come from the per-church cache, so this pass does no
+        # hashing work of its own
+        seen_pids = set()
+        seen_hashes = set()
+        cleaned = []
         duplicates_by_place_id = 0
         duplicates_by_hash = 0
-        
+
         for church in churches:
             # Check place_id
-            if church.place_id in unique_by_place_id:
+            if church.place_id in seen_pids:
                 duplicates_by_place_id += 1
                 continue
-            
+
             # Check hash
             church_hash = self._compute_church_hash(church)
-            if church_hash in unique_by_hash:
+            if church_hash in seen_hashes:
                 duplicates_by_hash += 1
-                logger.debug(f"   Hash collision: {church.name} in {getattr(church, 'city', 'Unknown')}")
+                logger.debug(f"   Hash collision: {church.name} in {church.city or 'Unknown'}")
                 continue
-            
+
             # Keep this church
-            unique_by_place_id[church.place_id] = church
-            unique_by_hash[church_hash] = church
-        
-        cleaned = list(unique_by_place_id.values())
+            seen_pids.add(church.place_id)
+            seen_hashes.add(church_hash)
+            cleaned.append(church)
         
         # Sort by state, then city, then name
         cleaned.sort(key=lambda c: (
-            getattr(c, 'state', 'ZZ'),
-            getattr(c, 'city', 'Unknown'),
+            c.state or 'ZZ',
+            c.city or 'Unknown',
             c.name
         ))
         
@@ -371,51 +598,16 @@ class GlobalChurchDatabase:
         return cleaned
     
     def _search_country(self, country_name: str, max_results: int) -> List[GooglePlaceChurch]:
-        """Search for churches in a country using text search"""
-        # Use the existing text search functionality
-        url = f"{self.discovery.base_url}/textsearch/json"
-        
-        params = {
-            'query': f'Coptic Orthodox Church in {country_name}',
-            'key': self.discovery.api_key
-        }
-        
-        churches = []
-        seen_place_ids = set()
-        
+        """Search for churches in a country using a single v1 text search"""
+        # The field-masked v1 search returns everything we persist in one
+        # response, so there is no per-place details fetch here anymore
         try:
-            import requests
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('status') == 'OK':
-                for place in data.get('results', []):
-                    if len(churches) >= max_results:
-                        break
-                        
-                    place_id = place.get('place_id')
-                    
-                    if place_id in seen_place_ids:
-                        continue
-                    
-                    seen_place_ids.add(place_id)
-                    
-                    # Get detailed information
-                    details = self.discovery._get_place_details(place_id)
-                    
-                    if details:
-                        church = self.discovery._parse_church_data(details)
-                        if church:
-                            churches.append(church)
-                    
-                    time.sleep(0.2)  # Rate limiting
-            
+            return self.discovery.search_text_v1(
+                f'Coptic Orthodox Church in {country_name}', max_results
+            )
         except Exception as e:
             logger.error(f"Error searching {country_name}: {e}")
-        
-        return churches
+            return []
     
     def save_to_database(self, db_path: str = 'coptic_events.db'):
         """Save all discovered churches to database"""
@@ -5,10 +5,16 @@ One-time population of high-quality church data from Google Maps
 
 import os
 import logging
+import random
 import requests
 import time
 from typing import List, Dict, Optional
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+
+from src.http_cache import HttpCache
+from src.rate_limiter import places_rate_limiter
 
 # Load environment variables from .env file
 try:
@@ -17,10 +23,34 @@ try:
 except ImportError:
     pass  # dotenv not required if using system env vars
 
+# orjson parses the large nested Places payloads several times faster
+# than the stdlib tokenizer; fall back silently when unavailable
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
+# One pooled session for all Places traffic: connections to
+# maps.googleapis.com are kept alive and reused, so concurrent detail
+# workers skip the TCP+TLS handshake on every call after the first
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
+# Address-component types we extract, mapped to the church field they
+# fill and whether the short form is wanted (state codes, e.g. 'NJ')
+_ADDRESS_COMPONENT_FIELDS = {
+    'locality': ('city', False),
+    'administrative_area_level_1': ('state', True),
+    'country': ('country', False),
+    'postal_code': ('postal_code', False),
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class GooglePlaceChurch:
     """Church data from Google Places"""
     place_id: str
@@ -35,11 +65,83 @@ class GooglePlaceChurch:
     opening_hours: Optional[Dict] = None
     photos: Optional[List[str]] = None
     vicinity: Optional[str] = None
+    # Parsed address components and metadata
+    city: Optional[str] = None
+    state: Optional[str] = None
+    country: Optional[str] = None
+    postal_code: Optional[str] = None
+    types: Optional[str] = None
+    business_status: Optional[str] = None
+    google_maps_url: Optional[str] = None
 
 
 class GooglePlacesChurchDiscovery:
     """Discover Coptic Orthodox churches using Google Places API"""
-    
+
+    # Transient conditions worth retrying with backoff; anything else is a
+    # real error and surfaces immediately
+    RETRYABLE_HTTP_STATUSES = (429, 500, 502, 503, 504)
+    RETRYABLE_API_STATUSES = ('OVER_QUERY_LIMIT', 'RESOURCE_EXHAUSTED', 'UNKNOWN_ERROR')
+    MAX_ATTEMPTS = 5
+
+    # Concurrent place-details fetches per search; the shared token bucket
+    # still bounds the aggregate request rate
+    DETAIL_WORKERS = 8
+
+    # Only the fields we actually persist or display - Places bills by
+    # field category, and photos/opening_hours/url were fetched but never
+    # written anywhere
+    DETAIL_FIELDS = ','.join([
+        'place_id', 'name', 'formatted_address', 'geometry',
+        'formatted_phone_number', 'website', 'rating',
+        'user_ratings_total', 'vicinity', 'address_components',
+        'business_status'
+    ])
+
+    # Places API v1 text search returns everything we persist in one
+    # response when asked via field mask - no per-place detail fetch
+    V1_SEARCH_URL = 'https://places.googleapis.com/v1/places:searchText'
+    V1_FIELD_MASK = ','.join([
+        'places.id', 'places.displayName', 'places.formattedAddress',
+        'places.location', 'places.rating', 'places.userRatingCount',
+        'places.types', 'places.websiteUri', 'places.internationalPhoneNumber',
+        'places.addressComponents', 'places.businessStatus', 'places.googleMapsUri'
+    ])
+
+    # Single source of truth for state code -> full name; query text uses
+    # the full name, and GlobalChurchDatabase derives its region list from
+    # this so the two can't drift apart
+    STATE_NAMES = {
+        'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
+        'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware',
+        'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho',
+        'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas',
+        'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
+        'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi',
+        'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
+        'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
+        'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma',
+        'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
+        'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah',
+        'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia',
+        'WI': 'Wisconsin', 'WY': 'Wyoming', 'DC': 'Washington DC',
+    }
+
+    # Bounding boxes (min_lat, min_lon, max_lat, max_lon) for states large
+    # enough to overflow Google's ~60-results-per-query cap; these get an
+    # additional grid sweep so results aren't silently truncated
+    STATE_BBOXES = {
+        'CA': (32.5, -124.4, 42.0, -114.1),
+        'TX': (25.8, -106.6, 36.5, -93.5),
+        'FL': (24.5, -87.6, 31.0, -80.0),
+        'NY': (40.5, -79.8, 45.0, -71.8),
+        'NJ': (38.9, -75.6, 41.4, -73.9),
+        'PA': (39.7, -80.5, 42.3, -74.7),
+        'IL': (36.9, -91.5, 42.5, -87.0),
+        'MI': (41.7, -90.4, 48.3, -82.4),
+        'OH': (38.4, -84.8, 42.0, -80.5),
+    }
+
     def __init__(self, api_key: str = None):
         """
         Initialize with Google Places API key
@@ -60,76 +162,174 @@ class GooglePlacesChurchDiscovery:
             )
         
         self.base_url = "https://maps.googleapis.com/maps/api/place"
+        # Endpoint URLs assembled once here rather than per request
+        self._nearby_url = f"{self.base_url}/nearbysearch/json"
+        self._text_search_url = f"{self.base_url}/textsearch/json"
+        self._details_url = f"{self.base_url}/details/json"
+        # Token bucket shared by all outbound Places calls; runs at the
+        # permitted QPS instead of a worst-case fixed delay per request
+        self.rate_limiter = places_rate_limiter()
+        # Persistent response cache so refresh runs skip still-fresh data
+        self.http_cache = HttpCache('places_http_cache.db')
     
-    def search_churches_in_state(self, state: str, max_results: int = 60) -> List[GooglePlaceChurch]:
+    def search_churches_in_state(self, state: str, max_results: int = 60,
+                                 seen_place_ids: set = None) -> List[GooglePlaceChurch]:
         """
         Search for all Coptic Orthodox churches in a state
-        
+
         Args:
             state: State abbreviation (e.g., 'NJ', 'NY')
             max_results: Maximum churches to return (default 60)
-            
+            seen_place_ids: Optional shared set of already-fetched place
+                ids; passing one across calls prevents paying for the same
+                Place Details fetch in multiple regions
+
         Returns:
             List of GooglePlaceChurch objects with verified data
         """
-        state_names = {
-            'NJ': 'New Jersey',
-            'NY': 'New York',
-            'CT': 'Connecticut',
-            'PA': 'Pennsylvania'
-        }
-        
-        state_full = state_names.get(state.upper(), state)
+        state_full = self.STATE_NAMES.get(state.upper(), state)
         
         logger.info(f"🔍 Searching Google Places for Coptic Orthodox churches in {state_full}...")
         
         # Use Text Search API
         churches = []
-        
-        # Multiple search queries to catch all churches
-        queries = [
-            f"Coptic Orthodox Church in {state_full}",
-            f"Coptic Church {state_full}",
-            f"St. Mary Coptic Church {state_full}",
-            f"St. Mark Coptic Church {state_full}",
-        ]
-        
-        seen_place_ids = set()
-        
-        for query in queries:
-            results = self._text_search(query)
-            
-            for place in results:
-                place_id = place.get('place_id')
-                
-                if place_id in seen_place_ids:
+
+        if seen_place_ids is None:
+            seen_place_ids = set()
+
+        # One broad paginated query: now that pagination is followed, the
+        # old four-variant fan-out ("St. Mary ...", "St. Mark ...") only
+        # re-returned the same places. The v1 search is field-masked, so
+        # no detail fetches are needed either.
+        query = f"Coptic Orthodox Church in {state_full}"
+        for church in self.search_text_v1(query, max_results):
+            if not church.place_id or church.place_id in seen_place_ids:
+                continue
+
+            seen_place_ids.add(church.place_id)
+            churches.append(church)
+            logger.info(f"   ✓ Found: {church.name}")
+
+        churches = churches[:max_results]
+
+        # Large states can overflow the per-query result cap; sweep a grid
+        # of nearby searches to pick up whatever the text queries missed
+        bbox = self.STATE_BBOXES.get(state.upper())
+        if bbox and len(churches) < max_results:
+            grid_churches = self.search_churches_in_grid(
+                *bbox,
+                seen_place_ids=seen_place_ids,
+                max_results=max_results - len(churches)
+            )
+            if grid_churches:
+                logger.info(f"   ✓ Grid sweep added {len(grid_churches)} more churches")
+                churches.extend(grid_churches)
+
+        logger.info(f"✅ Found {len(churches)} Coptic Orthodox churches in {state_full}")
+
+        return churches
+    
+    def search_churches_in_grid(self, min_lat: float, min_lon: float,
+                                max_lat: float, max_lon: float,
+                                grid_size: int = 4,
+                                seen_place_ids: set = None,
+                                max_results: int = None) -> List[GooglePlaceChurch]:
+        """
+        Sweep a bounding box with an NxN grid of nearby searches.
+
+        A single text/nearby query is hard-capped at ~60 results, so one
+        query per large state silently truncates. Searching each grid cell
+        with a circumscribing radius and unioning by place_id recovers the
+        churches beyond the cap.
+        """
+        import math
+
+        seen_place_ids = seen_place_ids if seen_place_ids is not None else set()
+        churches = []
+
+        cell_lat = (max_lat - min_lat) / grid_size
+        cell_lon = (max_lon - min_lon) / grid_size
+
+        url = self._nearby_url
+
+        for row in range(grid_size):
+            for col in range(grid_size):
+                center_lat = min_lat + (row + 0.5) * cell_lat
+                center_lon = min_lon + (col + 0.5) * cell_lon
+
+                # Radius circumscribing the cell (meters)
+                half_lat_m = cell_lat / 2 * 111_000
+                half_lon_m = cell_lon / 2 * 111_000 * math.cos(math.radians(center_lat))
+                radius = int(math.hypot(half_lat_m, half_lon_m))
+
+                params = {
+                    'location': f"{center_lat},{center_lon}",
+                    'radius': min(radius, 50_000),  # API max radius
+                    'keyword': 'Coptic Orthodox Church',
+                    'key': self.api_key
+                }
+
+                # Each nearby page holds at most 20 results; follow
+                # next_page_token so dense cells aren't truncated
+                new_place_ids = []
+                while True:
+                    data = self._get_json(url, params) or {}
+                    if data.get('status') not in ('OK', 'ZERO_RESULTS'):
+                        logger.warning(f"Grid cell search returned status: {data.get('status')}")
+                        break
+
+                    for place in data.get('results', []):
+                        place_id = place.get('place_id')
+                        if not place_id or place_id in seen_place_ids:
+                            continue
+                        seen_place_ids.add(place_id)
+                        new_place_ids.append(place_id)
+
+                    token = data.get('next_page_token')
+                    if not token:
+                        break
+                    # Tokens take a moment to activate server-side
+                    time.sleep(2)
+                    params = {'pagetoken': token, 'key': self.api_key}
+
+                churches.extend(self._fetch_church_details(new_place_ids))
+                if max_results and len(churches) >= max_results:
+                    return churches[:max_results]
+
+        return churches
+
+    def _fetch_church_details(self, place_ids: List[str]) -> List[GooglePlaceChurch]:
+        """
+        Fetch and parse place details for a batch of ids concurrently.
+
+        Text/nearby searches produce place ids faster than serial detail
+        fetches consume them; a small worker pool overlaps the detail
+        round trips so a search finishes when its slowest detail returns,
+        not after the sum of all of them.
+        """
+        churches = []
+
+        if not place_ids:
+            return churches
+
+        max_workers = min(len(place_ids), self.DETAIL_WORKERS)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._get_place_details, pid) for pid in place_ids]
+            for future in as_completed(futures):
+                try:
+                    details = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching place details: {e}")
                     continue
-                    
-                seen_place_ids.add(place_id)
-                
-                # Get detailed information
-                details = self._get_place_details(place_id)
-                
                 if details:
                     church = self._parse_church_data(details)
                     if church:
                         churches.append(church)
-                        logger.info(f"   ✓ Found: {church.name}")
-                        
-                        if len(churches) >= max_results:
-                            break
-                
-                # Rate limiting - be nice to Google
-                time.sleep(0.2)
-            
-            if len(churches) >= max_results:
-                break
-        
-        logger.info(f"✅ Found {len(churches)} Coptic Orthodox churches in {state_full}")
-        
+
         return churches
-    
-    def search_churches_near_location(self, lat: float, lon: float, 
+
+    def search_churches_near_location(self, lat: float, lon: float,
                                      radius_miles: int = 15) -> List[GooglePlaceChurch]:
         """
         Search for Coptic Orthodox churches near a location
@@ -146,7 +346,7 @@ class GooglePlacesChurchDiscovery:
         
         logger.info(f"🔍 Searching Google Places within {radius_miles} miles of ({lat}, {lon})...")
         
-        url = f"{self.base_url}/nearbysearch/json"
+        url = self._nearby_url
         
         params = {
             'location': f"{lat},{lon}",
@@ -156,13 +356,10 @@ class GooglePlacesChurchDiscovery:
         }
         
         churches = []
-        
+
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
+            data = self._get_json(url, params) or {}
+
             if data.get('status') == 'OK':
                 for place in data.get('results', []):
                     place_id = place.get('place_id')
@@ -175,9 +372,7 @@ class GooglePlacesChurchDiscovery:
                         if church:
                             churches.append(church)
                             logger.info(f"   ✓ Found: {church.name}")
-                    
-                    time.sleep(0.2)  # Rate limiting
-            
+
             logger.info(f"✅ Found {len(churches)} churches")
             
         except Exception as e:
@@ -185,92 +380,236 @@ class GooglePlacesChurchDiscovery:
         
         return churches
     
+    def _get_json(self, url: str, params: Dict, timeout: int = 30) -> Optional[Dict]:
+        """
+        Rate-limited GET returning parsed JSON, with exponential-backoff
+        retry on 429/5xx responses and quota-exhausted API statuses.
+
+        A single transient failure used to drop a whole region's data;
+        retrying here keeps that from happening. Successful bodies are
+        stored in the persistent cache and reused while fresh.
+        """
+        cache_key = self.http_cache.make_key(url, params)
+        cached = self.http_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        delay = 1.0
+
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            retry_reason = None
+
+            self.rate_limiter.acquire()
+            try:
+                response = _SESSION.get(url, params=params, timeout=timeout)
+
+                if response.status_code in self.RETRYABLE_HTTP_STATUSES:
+                    retry_reason = f"HTTP {response.status_code}"
+                    if response.status_code == 429:
+                        self.rate_limiter.penalize()
+                else:
+                    response.raise_for_status()
+                    data = _json_loads(response.content)
+                    if data.get('status') in self.RETRYABLE_API_STATUSES:
+                        retry_reason = f"API status {data.get('status')}"
+                    else:
+                        self.http_cache.put(cache_key, data)
+                        return data
+
+            except requests.RequestException as e:
+                retry_reason = str(e)
+
+            if attempt == self.MAX_ATTEMPTS:
+                break
+
+            # Exponential backoff with jitter, capped at 60s
+            wait = min(delay, 60) * (1 + random.random() * 0.25)
+            logger.warning(f"Transient Places error ({retry_reason}), retry {attempt}/{self.MAX_ATTEMPTS - 1} in {wait:.1f}s")
+            time.sleep(wait)
+            delay *= 2
+
+        logger.error(f"Giving up after {self.MAX_ATTEMPTS} attempts ({retry_reason})")
+        return None
+
+    def _post_json(self, url: str, body: Dict, headers: Dict) -> Optional[Dict]:
+        """POST counterpart of _get_json with the same retry/backoff policy"""
+        delay = 1.0
+
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            retry_reason = None
+
+            self.rate_limiter.acquire()
+            try:
+                response = _SESSION.post(url, json=body, headers=headers, timeout=30)
+
+                if response.status_code in self.RETRYABLE_HTTP_STATUSES:
+                    retry_reason = f"HTTP {response.status_code}"
+                    if response.status_code == 429:
+                        self.rate_limiter.penalize()
+                else:
+                    response.raise_for_status()
+                    return _json_loads(response.content)
+
+            except requests.RequestException as e:
+                retry_reason = str(e)
+
+            if attempt == self.MAX_ATTEMPTS:
+                break
+
+            wait = min(delay, 60) * (1 + random.random() * 0.25)
+            logger.warning(f"Transient Places error ({retry_reason}), retry {attempt}/{self.MAX_ATTEMPTS - 1} in {wait:.1f}s")
+            time.sleep(wait)
+            delay *= 2
+
+        logger.error(f"Giving up after {self.MAX_ATTEMPTS} attempts ({retry_reason})")
+        return None
+
+    def search_text_v1(self, query: str, max_results: int = 60) -> List[GooglePlaceChurch]:
+        """
+        Text search via Places API v1 with a field mask.
+
+        One request returns every field we persist, eliminating the
+        N+1 place-details fetch (and its per-place billing) entirely.
+        """
+        cache_key = self.http_cache.make_key(
+            self.V1_SEARCH_URL, {'textQuery': query, 'fields': self.V1_FIELD_MASK}
+        )
+        data = self.http_cache.get(cache_key)
+
+        if data is None:
+            headers = {
+                'X-Goog-Api-Key': self.api_key,
+                # nextPageToken must be in the mask or pagination stops
+                'X-Goog-FieldMask': self.V1_FIELD_MASK + ',nextPageToken',
+                'Content-Type': 'application/json',
+            }
+
+            # Follow pagination: one page holds at most 20 places, so a
+            # single un-paginated request silently capped every query
+            places = []
+            body = {'textQuery': query}
+            while True:
+                page = self._post_json(self.V1_SEARCH_URL, body, headers)
+                if page is None:
+                    break
+                places.extend(page.get('places', []))
+                token = page.get('nextPageToken')
+                if not token or len(places) >= max_results:
+                    break
+                body['pageToken'] = token
+
+            if not places:
+                return []
+            # Cache the aggregated pages under the query key
+            data = {'places': places}
+            self.http_cache.put(cache_key, data)
+
+        churches = []
+        for place in data.get('places', [])[:max_results]:
+            church = self._parse_church_data_v1(place)
+            if church:
+                churches.append(church)
+
+        return churches
+
+    @staticmethod
+    def _extract_address_parts(components: List[Dict], long_key: str, short_key: str) -> Dict:
+        """Map address components to church fields in one pass.
+
+        One dict probe per component type instead of a chain of linear
+        membership tests against each target type.
+        """
+        parts = {}
+        for component in components:
+            for ctype in component.get('types', ()):
+                target = _ADDRESS_COMPONENT_FIELDS.get(ctype)
+                if target and target[0] not in parts:
+                    parts[target[0]] = component.get(short_key if target[1] else long_key)
+                    break
+        return parts
+
+    def _parse_church_data_v1(self, place: Dict) -> Optional[GooglePlaceChurch]:
+        """Parse a Places API v1 place into a GooglePlaceChurch object"""
+        try:
+            location = place.get('location', {})
+            parts = self._extract_address_parts(
+                place.get('addressComponents', []), 'longText', 'shortText'
+            )
+
+            return GooglePlaceChurch(
+                place_id=place.get('id'),
+                name=(place.get('displayName') or {}).get('text'),
+                address=place.get('formattedAddress'),
+                latitude=location.get('latitude'),
+                longitude=location.get('longitude'),
+                phone=place.get('internationalPhoneNumber'),
+                website=place.get('websiteUri'),
+                rating=place.get('rating'),
+                user_ratings_total=place.get('userRatingCount'),
+                city=parts.get('city'),
+                state=parts.get('state'),
+                country=parts.get('country'),
+                postal_code=parts.get('postal_code'),
+                types=','.join(place.get('types', [])),
+                business_status=place.get('businessStatus'),
+                google_maps_url=place.get('googleMapsUri'),
+            )
+
+        except Exception as e:
+            logger.error(f"Error parsing v1 church data: {e}")
+            return None
+
     def _text_search(self, query: str) -> List[Dict]:
         """Perform a text search"""
-        url = f"{self.base_url}/textsearch/json"
+        url = self._text_search_url
         
         params = {
             'query': query,
             'key': self.api_key
         }
-        
-        try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('status') == 'OK':
-                return data.get('results', [])
-            elif data.get('status') == 'ZERO_RESULTS':
-                logger.debug(f"No results for: {query}")
-                return []
-            else:
-                logger.warning(f"Search returned status: {data.get('status')}")
-                return []
-                
-        except Exception as e:
-            logger.error(f"Error in text search: {e}")
+
+        data = self._get_json(url, params)
+        if not data:
+            return []
+
+        if data.get('status') == 'OK':
+            return data.get('results', [])
+        elif data.get('status') == 'ZERO_RESULTS':
+            logger.debug(f"No results for: {query}")
+            return []
+        else:
+            logger.warning(f"Search returned status: {data.get('status')}")
             return []
     
     def _get_place_details(self, place_id: str) -> Optional[Dict]:
         """Get detailed information about a place"""
-        url = f"{self.base_url}/details/json"
-        
-        fields = [
-            'place_id', 'name', 'formatted_address', 'geometry',
-            'formatted_phone_number', 'website', 'rating',
-            'user_ratings_total', 'opening_hours', 'photos', 'vicinity',
-            'address_components', 'types', 'business_status', 'url',
-            'international_phone_number'
-        ]
+        url = self._details_url
         
         params = {
             'place_id': place_id,
-            'fields': ','.join(fields),
+            'fields': self.DETAIL_FIELDS,
             'key': self.api_key
         }
-        
-        try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('status') == 'OK':
-                return data.get('result')
-            else:
-                logger.warning(f"Place details returned status: {data.get('status')}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error getting place details: {e}")
+
+        data = self._get_json(url, params)
+        if not data:
+            return None
+
+        if data.get('status') == 'OK':
+            return data.get('result')
+        else:
+            logger.warning(f"Place details returned status: {data.get('status')}")
             return None
     
     def _parse_church_data(self, details: Dict) -> Optional[GooglePlaceChurch]:
         """Parse Google Place details into GooglePlaceChurch object"""
         try:
             location = details.get('geometry', {}).get('location', {})
-            
-            # Extract address components
-            address_components = details.get('address_components', [])
-            city = None
-            state = None
-            country = None
-            postal_code = None
-            
-            for component in address_components:
-                types = component.get('types', [])
-                if 'locality' in types:
-                    city = component.get('long_name')
-                elif 'administrative_area_level_1' in types:
-                    state = component.get('short_name')
-                elif 'country' in types:
-                    country = component.get('long_name')
-                elif 'postal_code' in types:
-                    postal_code = component.get('long_name')
-            
-            church = GooglePlaceChurch(
+            parts = self._extract_address_parts(
+                details.get('address_components', []), 'long_name', 'short_name'
+            )
+
+            return GooglePlaceChurch(
                 place_id=details.get('place_id'),
                 name=details.get('name'),
                 address=details.get('formatted_address'),
@@ -282,20 +621,16 @@ class GooglePlacesChurchDiscovery:
                 user_ratings_total=details.get('user_ratings_total'),
                 opening_hours=details.get('opening_hours'),
                 photos=details.get('photos'),
-                vicinity=details.get('vicinity')
+                vicinity=details.get('vicinity'),
+                city=parts.get('city'),
+                state=parts.get('state'),
+                country=parts.get('country'),
+                postal_code=parts.get('postal_code'),
+                types=','.join(details.get('types', [])),
+                business_status=details.get('business_status'),
+                google_maps_url=details.get('url'),
             )
             
-            # Add parsed address components as attributes
-            church.city = city
-            church.state = state
-            church.country = country
-            church.postal_code = postal_code
-            church.types = ','.join(details.get('types', []))
-            church.business_status = details.get('business_status')
-            church.google_maps_url = details.get('url')
-            
-            return church
-            
         except Exception as e:
             logger.error(f"Error parsing church data: {e}")
             return None
@@ -309,33 +644,37 @@ class GooglePlacesChurchDiscovery:
         db = EventDatabase(db_path)
         saved_count = 0
         error_count = 0
-        
+
         logger.info(f"💾 Saving {len(churches)} churches to database...")
-        
+
+        # Single transaction for the whole batch: one fsync instead of
+        # one per church
         for church in churches:
             try:
                 db.add_church(
                     name=church.name,
                     address=church.address,
-                    city=getattr(church, 'city', None),
-                    state=getattr(church, 'state', None),
-                    country=getattr(church, 'country', 'USA'),
+                    city=church.city,
+                    state=church.state,
+                    country=church.country or 'USA',
                     website=church.website,
                     phone=church.phone,
                     latitude=church.latitude,
                     longitude=church.longitude,
-                    place_id=church.place_id
+                    place_id=church.place_id,
+                    commit=False
                 )
                 saved_count += 1
-                
+
                 if saved_count % 100 == 0:
                     logger.info(f"   ✓ Saved {saved_count}/{len(churches)} churches...")
-                    
+
             except Exception as e:
                 error_count += 1
                 if error_count <= 5:  # Only show first few errors
                     logger.error(f"   ❌ Failed to save {church.name}: {e}")
-        
+
+        db.conn.commit()
         logger.info(f"✅ Saved {saved_count} churches ({error_count} errors)")
         return saved_count
 
@@ -1,6 +1,10 @@
 """HTML calendar generator for selected events"""
 
+import html
+import json
 import logging
+import re
+from functools import lru_cache
 from typing import List
 from datetime import datetime
 from pathlib import Path
@@ -8,120 +12,133 @@ from src.event_model import ServiceEvent
 
 logger = logging.getLogger(__name__)
 
+# Translation table for embedding text in single/double-quoted JS string
+# literals; one C-level pass instead of three chained str.replace scans
+_JS_ESCAPE = str.maketrans({"'": "\\'", '"': '\\"', '\n': '\\n'})
 
-class HTMLCalendarGenerator:
-    """Generates interactive HTML calendar page"""
-    
-    def generate(self, events: List[ServiceEvent], output_file: str = "my_events.html") -> str:
-        """Generate HTML file with Add to Calendar buttons"""
-        if not events:
-            logger.warning("No events to generate HTML for")
-            return None
-        
-        html = self._build_html(events)
-        
-        # Write to file
-        output_path = Path(output_file)
-        output_path.write_text(html, encoding='utf-8')
-        
-        logger.info(f"Generated HTML calendar: {output_path.absolute()}")
-        return str(output_path.absolute())
-    
-    def _build_html(self, events: List[ServiceEvent]) -> str:
-        """Build complete HTML page"""
-        # Sort events by date
-        sorted_events = sorted(events, key=lambda e: (e.date if e.date != 'TBD' else '9999-12-31', e.time if e.time != 'TBD' else '23:59'))
-        
-        event_cards = '\n'.join([self._build_event_card(event, i) for i, event in enumerate(sorted_events)])
-        
-        html = f"""<!DOCTYPE html>
+
+def _escape_js(text) -> str:
+    """Escape text for use inside a JavaScript string literal"""
+    if not text:
+        return ''
+    return str(text).translate(_JS_ESCAPE)
+
+
+# Badge classification keywords, compiled once: each alternation is a
+# single C-level scan instead of one Python substring check per keyword
+_SERVICE_RE = re.compile(r'service|food|homeless|hospital|nursing')
+_FESTIVAL_RE = re.compile(r'festival|feast')
+
+
+@lru_cache(maxsize=64)
+def _type_class(event_type: str) -> str:
+    """CSS class for an event type badge.
+
+    The type vocabulary is a couple dozen strings repeated across every
+    card, so the scans below run once per distinct type instead of
+    5-7 per card.
+    """
+    if 'mission' in event_type:
+        return 'type-mission'
+    if _SERVICE_RE.search(event_type):
+        return 'type-service'
+    if _FESTIVAL_RE.search(event_type):
+        return 'type-festival'
+    return 'type-social'
+
+
+# Static page scaffolding, built once at import. Only the stats header
+# and the event cards vary between renders, so the CSS block and the
+# modal/script footer live here as plain strings instead of being
+# re-assembled (with {{ }} escaping) inside an f-string on every call.
+_STATIC_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>My Coptic Orthodox Events</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
-        
-        body {{
+        }
+
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 20px;
-        }}
-        
-        .container {{
+        }
+
+        .container {
             max-width: 1200px;
             margin: 0 auto;
-        }}
-        
-        .header {{
+        }
+
+        .header {
             background: white;
             padding: 30px;
             border-radius: 12px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
             margin-bottom: 30px;
             text-align: center;
-        }}
-        
-        .header h1 {{
+        }
+
+        .header h1 {
             color: #2d3748;
             font-size: 2.5rem;
             margin-bottom: 10px;
-        }}
-        
-        .header .subtitle {{
+        }
+
+        .header .subtitle {
             color: #718096;
             font-size: 1.1rem;
-        }}
-        
-        .stats {{
+        }
+
+        .stats {
             display: flex;
             justify-content: center;
             gap: 30px;
             margin-top: 20px;
-        }}
-        
-        .stat {{
+        }
+
+        .stat {
             text-align: center;
-        }}
-        
-        .stat-number {{
+        }
+
+        .stat-number {
             font-size: 2rem;
             font-weight: bold;
             color: #667eea;
-        }}
-        
-        .stat-label {{
+        }
+
+        .stat-label {
             color: #718096;
             font-size: 0.9rem;
-        }}
-        
-        .events-grid {{
+        }
+
+        .events-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
             gap: 20px;
             margin-bottom: 40px;
-        }}
-        
-        .event-card {{
+        }
+
+        .event-card {
             background: white;
             border-radius: 12px;
             padding: 24px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
             transition: transform 0.2s, box-shadow 0.2s;
-        }}
-        
-        .event-card:hover {{
+        }
+
+        .event-card:hover {
             transform: translateY(-4px);
             box-shadow: 0 8px 12px rgba(0,0,0,0.15);
-        }}
-        
-        .event-type {{
+        }
+
+        .event-type {
             display: inline-block;
             padding: 4px 12px;
             border-radius: 20px;
@@ -129,46 +146,46 @@ class HTMLCalendarGenerator:
             font-weight: 600;
             text-transform: uppercase;
             margin-bottom: 12px;
-        }}
-        
-        .type-service {{ background: #d4edda; color: #155724; }}
-        .type-mission {{ background: #fff3cd; color: #856404; }}
-        .type-social {{ background: #cce5ff; color: #004085; }}
-        .type-festival {{ background: #f8d7da; color: #721c24; }}
-        
-        .event-title {{
+        }
+
+        .type-service { background: #d4edda; color: #155724; }
+        .type-mission { background: #fff3cd; color: #856404; }
+        .type-social { background: #cce5ff; color: #004085; }
+        .type-festival { background: #f8d7da; color: #721c24; }
+
+        .event-title {
             font-size: 1.3rem;
             font-weight: 700;
             color: #2d3748;
             margin-bottom: 12px;
             line-height: 1.3;
-        }}
-        
-        .event-church {{
+        }
+
+        .event-church {
             color: #667eea;
             font-weight: 600;
             margin-bottom: 12px;
             font-size: 0.95rem;
-        }}
-        
-        .event-details {{
+        }
+
+        .event-details {
             margin: 12px 0;
-        }}
-        
-        .detail-row {{
+        }
+
+        .detail-row {
             display: flex;
             align-items: center;
             margin: 8px 0;
             color: #4a5568;
             font-size: 0.9rem;
-        }}
-        
-        .detail-icon {{
+        }
+
+        .detail-icon {
             margin-right: 8px;
             font-size: 1.1rem;
-        }}
-        
-        .event-description {{
+        }
+
+        .event-description {
             color: #718096;
             font-size: 0.9rem;
             line-height: 1.5;
@@ -176,15 +193,15 @@ class HTMLCalendarGenerator:
             max-height: 60px;
             overflow: hidden;
             text-overflow: ellipsis;
-        }}
-        
-        .event-actions {{
+        }
+
+        .event-actions {
             display: flex;
             gap: 10px;
             margin-top: 16px;
-        }}
-        
-        .btn {{
+        }
+
+        .btn {
             flex: 1;
             padding: 10px 16px;
             border: none;
@@ -195,27 +212,27 @@ class HTMLCalendarGenerator:
             text-decoration: none;
             text-align: center;
             font-size: 0.9rem;
-        }}
-        
-        .btn-calendar {{
+        }
+
+        .btn-calendar {
             background: #667eea;
             color: white;
-        }}
-        
-        .btn-calendar:hover {{
+        }
+
+        .btn-calendar:hover {
             background: #5568d3;
-        }}
-        
-        .btn-details {{
+        }
+
+        .btn-details {
             background: #e2e8f0;
             color: #2d3748;
-        }}
-        
-        .btn-details:hover {{
+        }
+
+        .btn-details:hover {
             background: #cbd5e0;
-        }}
-        
-        .modal {{
+        }
+
+        .modal {
             display: none;
             position: fixed;
             z-index: 1000;
@@ -225,9 +242,9 @@ class HTMLCalendarGenerator:
             height: 100%;
             background: rgba(0,0,0,0.5);
             padding: 20px;
-        }}
-        
-        .modal-content {{
+        }
+
+        .modal-content {
             background: white;
             margin: 50px auto;
             padding: 30px;
@@ -235,161 +252,235 @@ class HTMLCalendarGenerator:
             max-width: 600px;
             max-height: 80vh;
             overflow-y: auto;
-        }}
-        
-        .modal-header {{
+        }
+
+        .modal-header {
             margin-bottom: 20px;
             padding-bottom: 15px;
             border-bottom: 2px solid #e2e8f0;
-        }}
-        
-        .modal-title {{
+        }
+
+        .modal-title {
             font-size: 1.5rem;
             color: #2d3748;
             margin-bottom: 10px;
-        }}
-        
-        .close {{
+        }
+
+        .close {
             float: right;
             font-size: 28px;
             font-weight: bold;
             color: #718096;
             cursor: pointer;
-        }}
-        
-        .close:hover {{
+        }
+
+        .close:hover {
             color: #2d3748;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
-        <div class="header">
-            <h1>🕊️ My Coptic Orthodox Events</h1>
-            <p class="subtitle">Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
-            <div class="stats">
-                <div class="stat">
-                    <div class="stat-number">{len(events)}</div>
-                    <div class="stat-label">Selected Events</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-number">{len(set(e.church_name for e in events))}</div>
-                    <div class="stat-label">Churches</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-number">{len([e for e in events if e.date != 'TBD'])}</div>
-                    <div class="stat-label">Scheduled</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="events-grid">
-            {event_cards}
-        </div>
+"""
+
+_STATIC_FOOTER = """        </div>
     </div>
-    
+
     <div id="eventModal" class="modal">
         <div class="modal-content">
             <span class="close">&times;</span>
             <div id="modalBody"></div>
         </div>
     </div>
-    
+
     <script>
-        function addToGoogleCalendar(title, church, date, time, location, description, url) {{
+        function addToGoogleCalendar(title, church, date, time, location, description, url) {
             // Format for Google Calendar
             let startDate = date !== 'TBD' ? date.replace(/-/g, '') : '';
             let startTime = time !== 'TBD' ? time.replace(/:/g, '') : '120000';
-            
+
             // If no date, default to next month
-            if (!startDate) {{
+            if (!startDate) {
                 let nextMonth = new Date();
                 nextMonth.setMonth(nextMonth.getMonth() + 1);
                 startDate = nextMonth.toISOString().split('T')[0].replace(/-/g, '');
-            }}
-            
+            }
+
             let fullTitle = encodeURIComponent(title + ' - ' + church);
             let fullLocation = encodeURIComponent(location);
             let fullDescription = encodeURIComponent(description + '\\n\\nSource: ' + url);
-            
-            let googleUrl = `https://calendar.google.com/calendar/render?action=TEMPLATE&text=${{fullTitle}}&dates=${{startDate}}T${{startTime}}/${{startDate}}T${{startTime}}&location=${{fullLocation}}&details=${{fullDescription}}`;
-            
+
+            let googleUrl = `https://calendar.google.com/calendar/render?action=TEMPLATE&text=${fullTitle}&dates=${startDate}T${startTime}/${startDate}T${startTime}&location=${fullLocation}&details=${fullDescription}`;
+
             window.open(googleUrl, '_blank');
-        }}
-        
-        function showDetails(eventData) {{
+        }
+
+        function showDetails(eventData) {
             let modal = document.getElementById('eventModal');
             let modalBody = document.getElementById('modalBody');
-            
+
             let html = `
                 <div class="modal-header">
                     <span class="close">&times;</span>
-                    <h2 class="modal-title">${{eventData.title}}</h2>
-                    <p style="color: #667eea; font-weight: 600;">${{eventData.church}}</p>
+                    <h2 class="modal-title">${eventData.title}</h2>
+                    <p style="color: #667eea; font-weight: 600;">${eventData.church}</p>
                 </div>
                 <div class="event-details">
-                    <div class="detail-row"><span class="detail-icon">📅</span> ${{eventData.date}} at ${{eventData.time}}</div>
-                    <div class="detail-row"><span class="detail-icon">📍</span> ${{eventData.location}}</div>
-                    <div class="detail-row"><span class="detail-icon">🏷️</span> ${{eventData.type}}</div>
-                    ${{eventData.distance ? '<div class="detail-row"><span class="detail-icon">📏</span> ' + eventData.distance + ' miles away</div>' : ''}}
+                    <div class="detail-row"><span class="detail-icon">📅</span> ${eventData.date} at ${eventData.time}</div>
+                    <div class="detail-row"><span class="detail-icon">📍</span> ${eventData.location}</div>
+                    <div class="detail-row"><span class="detail-icon">🏷️</span> ${eventData.type}</div>
+                    ${eventData.distance ? '<div class="detail-row"><span class="detail-icon">📏</span> ' + eventData.distance + ' miles away</div>' : ''}
                 </div>
                 <div style="margin: 20px 0;">
                     <h3 style="margin-bottom: 10px;">Description</h3>
-                    <p style="color: #4a5568; line-height: 1.6;">${{eventData.description}}</p>
+                    <p style="color: #4a5568; line-height: 1.6;">${eventData.description}</p>
                 </div>
-                ${{eventData.contact ? '<div style="margin: 20px 0;"><h3 style="margin-bottom: 10px;">Contact</h3><p>' + eventData.contact + '</p></div>' : ''}}
-                ${{eventData.url ? '<div style="margin: 20px 0;"><a href="' + eventData.url + '" target="_blank" style="color: #667eea;">View Source</a></div>' : ''}}
+                ${eventData.contact ? '<div style="margin: 20px 0;"><h3 style="margin-bottom: 10px;">Contact</h3><p>' + eventData.contact + '</p></div>' : ''}
+                ${eventData.url ? '<div style="margin: 20px 0;"><a href="' + eventData.url + '" target="_blank" style="color: #667eea;">View Source</a></div>' : ''}
             `;
-            
+
             modalBody.innerHTML = html;
             modal.style.display = 'block';
-            
+
             // Close button
-            modal.querySelector('.close').onclick = function() {{
+            modal.querySelector('.close').onclick = function() {
                 modal.style.display = 'none';
-            }};
-        }}
-        
+            };
+        }
+
         // Close modal on outside click
-        window.onclick = function(event) {{
+        window.onclick = function(event) {
             let modal = document.getElementById('eventModal');
-            if (event.target == modal) {{
+            if (event.target == modal) {
                 modal.style.display = 'none';
-            }}
-        }}
+            }
+        }
     </script>
 </body>
 </html>"""
-        
-        return html
-    
-    def _build_event_card(self, event: ServiceEvent, index: int) -> str:
+
+# Strip leading indentation from the static blocks once at import; the
+# browser doesn't need it and it is roughly a third of the bytes written
+# per render. Newlines stay, so the inline JS (// comments, template
+# literals) is untouched semantically.
+_STATIC_HEAD = re.sub(r'\n[ \t]+', '\n', _STATIC_HEAD)
+_STATIC_FOOTER = re.sub(r'\n[ \t]+', '\n', _STATIC_FOOTER)
+
+
+class HTMLCalendarGenerator:
+    """Generates interactive HTML calendar page"""
+
+    def generate(self, events: List[ServiceEvent], output_file: str = "my_events.html") -> str:
+        """Generate HTML file with Add to Calendar buttons"""
+        if not events:
+            logger.warning("No events to generate HTML for")
+            return None
+
+        html = self._build_html(events)
+
+        # Write with an explicit 64KB buffer; the page runs to several MB
+        # for large event lists and the default buffering is smaller
+        output_path = Path(output_file)
+        with open(output_path, 'w', encoding='utf-8', buffering=65536) as f:
+            f.write(html)
+
+        logger.info(f"Generated HTML calendar: {output_path.absolute()}")
+        return str(output_path.absolute())
+
+    def _build_html(self, events: List[ServiceEvent]) -> str:
+        """Build complete HTML page"""
+        # Sort events by date: decorate once in O(N), sort the plain
+        # tuples in C, then undecorate — instead of N log N key calls
+        # each re-evaluating the two TBD conditionals
+        keyed = [
+            ((e.date if e.date != 'TBD' else '9999-12-31',
+              e.time if e.time != 'TBD' else '23:59', i), e)
+            for i, e in enumerate(events)
+        ]
+        # The index breaks ties (keeping the sort stable) before the
+        # comparison could ever reach the non-comparable events
+        keyed.sort()
+        sorted_events = [e for _, e in keyed]
+
+        # One pass for the header stats instead of a set-comprehension
+        # plus a materialized filter list over the same events
+        churches = set()
+        scheduled = 0
+        for e in events:
+            churches.add(e.church_name)
+            scheduled += e.date != 'TBD'
+
+        header = f"""        <div class="header">
+            <h1>🕊️ My Coptic Orthodox Events</h1>
+            <p class="subtitle">Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
+            <div class="stats">
+                <div class="stat">
+                    <div class="stat-number">{len(events)}</div>
+                    <div class="stat-label">Selected Events</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-number">{len(churches)}</div>
+                    <div class="stat-label">Churches</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-number">{scheduled}</div>
+                    <div class="stat-label">Scheduled</div>
+                </div>
+            </div>
+        </div>
+
+        <div class="events-grid">
+"""
+
+        # Accumulate page fragments in one list and join once at the end;
+        # cards append straight into the buffer instead of returning
+        # multi-kilobyte strings that get joined again afterwards
+        parts = [_STATIC_HEAD, header]
+        for i, event in enumerate(sorted_events):
+            self._build_event_card(parts, event, i)
+        parts.append(_STATIC_FOOTER)
+
+        return ''.join(parts)
+
+    def _build_event_card(self, parts: list, event: ServiceEvent, index: int):
         """Build HTML for a single event card"""
-        # Determine event type class
-        type_class = 'type-social'
-        if event.is_mission_trip or 'mission' in event.event_type:
-            type_class = 'type-mission'
-        elif 'service' in event.event_type or any(x in event.event_type for x in ['food', 'homeless', 'hospital', 'nursing']):
-            type_class = 'type-service'
-        elif 'festival' in event.event_type or 'feast' in event.event_type:
-            type_class = 'type-festival'
-        
-        # Escape quotes for JavaScript
-        def escape_js(text):
-            if not text:
-                return ''
-            return str(text).replace("'", "\\'").replace('"', '\\"').replace('\n', '\\n')
-        
+        # Determine event type class (memoized per distinct type string)
+        type_class = 'type-mission' if event.is_mission_trip else _type_class(event.event_type)
+
         description = event.description or "No description available"
         contact_info = ""
         if event.contact_email or event.contact_phone:
             contact_info = f"{event.contact_email or ''} {event.contact_phone or ''}".strip()
-        
-        card = f"""
+
+        # Escape each reused field once instead of per occurrence
+        title_js = _escape_js(event.title)
+        church_js = _escape_js(event.church_name)
+        location_js = _escape_js(event.location)
+        description_js = _escape_js(description)
+        url_js = _escape_js(event.source_url or '')
+        pretty_type = event.event_type.replace('_', ' ')
+
+        # Serialize the details payload with json.dumps and let
+        # html.escape quote it for the attribute, instead of hand-escaping
+        # each field into a JS object literal
+        details_payload = html.escape(json.dumps({
+            "title": event.title,
+            "church": event.church_name,
+            "date": event.date,
+            "time": event.time,
+            "location": event.location,
+            "type": pretty_type,
+            "distance": str(getattr(event, 'distance_miles', '') or ''),
+            "description": description,
+            "contact": contact_info,
+            "url": event.source_url or '',
+        }, ensure_ascii=False, separators=(',', ':')), quote=True)
+
+        parts.append(f"""
         <div class="event-card">
-            <span class="event-type {type_class}">{event.event_type.replace('_', ' ')}</span>
-            <h3 class="event-title">{escape_js(event.title)}</h3>
-            <div class="event-church">📍 {escape_js(event.church_name)}</div>
+            <span class="event-type {type_class}">{pretty_type}</span>
+            <h3 class="event-title">{title_js}</h3>
+            <div class="event-church">📍 {church_js}</div>
             <div class="event-details">
                 <div class="detail-row">
                     <span class="detail-icon">📅</span>
@@ -397,33 +488,20 @@ class HTMLCalendarGenerator:
                 </div>
                 <div class="detail-row">
                     <span class="detail-icon">📍</span>
-                    {escape_js(event.location)}
+                    {location_js}
                 </div>
                 {f'<div class="detail-row"><span class="detail-icon">📏</span>{event.distance_miles} miles away</div>' if hasattr(event, 'distance_miles') and event.distance_miles else ''}
             </div>
             <div class="event-description">
-                {escape_js(description[:150])}{'...' if len(description) > 150 else ''}
+                {_escape_js(description[:150])}{'...' if len(description) > 150 else ''}
             </div>
             <div class="event-actions">
-                <button class="btn btn-calendar" onclick="addToGoogleCalendar('{escape_js(event.title)}', '{escape_js(event.church_name)}', '{event.date}', '{event.time}', '{escape_js(event.location)}', '{escape_js(description)}', '{escape_js(event.source_url or '')}')">
+                <button class="btn btn-calendar" onclick="addToGoogleCalendar('{title_js}', '{church_js}', '{event.date}', '{event.time}', '{location_js}', '{description_js}', '{url_js}')">
                     📅 Add to Calendar
                 </button>
-                <button class="btn btn-details" onclick='showDetails({{
-                    "title": "{escape_js(event.title)}",
-                    "church": "{escape_js(event.church_name)}",
-                    "date": "{event.date}",
-                    "time": "{event.time}",
-                    "location": "{escape_js(event.location)}",
-                    "type": "{event.event_type.replace('_', ' ')}",
-                    "distance": "{getattr(event, 'distance_miles', '') or ''}",
-                    "description": "{escape_js(description)}",
-                    "contact": "{escape_js(contact_info)}",
-                    "url": "{escape_js(event.source_url or '')}"
-                }})'>
+                <button class="btn btn-details" onclick="showDetails({details_payload})">
                     ℹ️ Details
                 </button>
             </div>
         </div>
-        """
-        
-        return card
+        """)
@@ -0,0 +1,82 @@
+"""Persistent SQLite cache for HTTP JSON responses"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """
+    URL-keyed response cache with a TTL.
+
+    Lets quarterly discovery refreshes skip Places endpoints whose
+    responses are still fresh, and makes a crashed run resume in seconds
+    instead of re-spending API budget on data we already have.
+    """
+
+    def __init__(self, path: str = 'http_cache.db', ttl_seconds: int = 90 * 86400):
+        self.ttl_seconds = ttl_seconds
+        # Worker threads share this connection; the lock serializes access
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                fetched_at INTEGER NOT NULL
+            )
+        ''')
+        # Evict anything already expired so the file doesn't grow unbounded
+        self._conn.execute(
+            'DELETE FROM http_cache WHERE fetched_at < ?',
+            (int(time.time()) - ttl_seconds,)
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Dict) -> str:
+        """Canonical cache key for a GET; credentials stay out of the key"""
+        filtered = sorted((k, v) for k, v in params.items() if k != 'key')
+        return f"{url}?{urlencode(filtered)}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached JSON body for key, or None if missing/expired"""
+        cutoff = int(time.time()) - self.ttl_seconds
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body FROM http_cache WHERE url = ? AND fetched_at >= ?',
+                (key, cutoff)
+            ).fetchone()
+
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            logger.warning(f"Dropping corrupt cache entry for {key}")
+            self.delete(key)
+            return None
+
+    def put(self, key: str, body: Dict):
+        """Store a JSON body for key"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO http_cache (url, body, fetched_at) VALUES (?, ?, ?)',
+                (key, json.dumps(body), int(time.time()))
+            )
+            self._conn.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute('DELETE FROM http_cache WHERE url = ?', (key,))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,22 +1,68 @@
 """Location service for determining search area"""
 
 import logging
+from functools import lru_cache
+from math import radians
 from typing import Tuple, Optional
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from geopy.geocoders import Nominatim
 from uszipcode import SearchEngine
 
 logger = logging.getLogger(__name__)
 
+# Pooled session so repeat lookups reuse the TCP+TLS connection instead
+# of handshaking per request
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+# One geocoder for the process; module-level so the cached lookup below
+# doesn't need a hashable self
+_GEOLOCATOR = Nominatim(user_agent="coptic-events-bot")
+
+# uszipcode's SearchEngine opens its bundled SQLite database and builds
+# SQLAlchemy metadata on construction; share one lazily across all
+# LocationService instances instead of paying that per instance
+_ZIP_SEARCH: Optional[SearchEngine] = None
+
+
+def _zip_search_engine() -> SearchEngine:
+    global _ZIP_SEARCH
+    if _ZIP_SEARCH is None:
+        _ZIP_SEARCH = SearchEngine()
+    return _ZIP_SEARCH
+
+
+@lru_cache(maxsize=8192)
+def _geocode_cached(address: str) -> Optional[Tuple[float, float]]:
+    """Geocode an address, caching results for the life of the process.
+
+    Nominatim round-trips cost ~500ms and discovery runs geocode the
+    same church addresses repeatedly; repeats are answered from memory.
+
+    Errors propagate: lru_cache doesn't cache a call that raises, so a
+    transient timeout is retried on the next lookup instead of being
+    negative-cached for the life of the process. A genuine not-found
+    (Nominatim answered, no match) is a settled result and is cached.
+    """
+    location = _GEOLOCATOR.geocode(address, timeout=10)
+    if location:
+        return location.latitude, location.longitude
+    return None
+
 
 class LocationService:
     """Handles location detection and geocoding"""
-    
+
     def __init__(self, config):
         self.config = config
-        self.geolocator = Nominatim(user_agent="coptic-events-bot")
-        self.zip_search = SearchEngine()
-    
+        self.geolocator = _GEOLOCATOR
+        self.zip_search = _zip_search_engine()
+        # ZIP lookups hit the uszipcode SQLite file; many churches share
+        # a ZIP, so remember resolved ones per service instance
+        self._zip_cache = {}
+
     def get_location(self) -> Tuple[float, float, str]:
         """
         Get location coordinates and name
@@ -29,73 +75,94 @@ class LocationService:
             if not zip_code:
                 raise ValueError("No location configured")
             return self._get_location_from_zip(zip_code)
-    
+
     def _get_current_location(self) -> Tuple[float, float, str]:
         """Get current location from IP address"""
         try:
-            response = requests.get('https://ipapi.co/json/', timeout=5)
+            response = _SESSION.get('https://ipapi.co/json/', timeout=5)
             data = response.json()
-            
+
             lat = data.get('latitude')
             lon = data.get('longitude')
             city = data.get('city')
             region = data.get('region')
-            
+
             location_name = f"{city}, {region}"
             logger.info(f"Detected location: {location_name}")
-            
+
             return lat, lon, location_name
         except Exception as e:
             logger.error(f"Error getting current location: {e}")
             raise
-    
+
     def _get_location_from_zip(self, zip_code: str) -> Tuple[float, float, str]:
         """Get location from ZIP code"""
+        cached = self._zip_cache.get(zip_code)
+        if cached is not None:
+            return cached
+
         try:
             zipcode_info = self.zip_search.by_zipcode(zip_code)
-            
+
             if not zipcode_info or not zipcode_info.lat:
                 raise ValueError(f"Invalid ZIP code: {zip_code}")
-            
+
             lat = zipcode_info.lat
             lon = zipcode_info.lng
             location_name = f"{zipcode_info.major_city}, {zipcode_info.state}"
-            
+
             logger.info(f"Location for ZIP {zip_code}: {location_name}")
-            
-            return lat, lon, location_name
+
+            result = (lat, lon, location_name)
+            self._zip_cache[zip_code] = result
+            return result
         except Exception as e:
             logger.error(f"Error getting location from ZIP: {e}")
             raise
-    
-    def calculate_distance(self, lat1: float, lon1: float, 
+
+    def calculate_distance(self, lat1: float, lon1: float,
                           lat2: float, lon2: float) -> float:
         """Calculate distance between two points in miles"""
         from math import radians, sin, cos, sqrt, atan2
-        
+
         R = 3959.0  # Earth radius in miles
-        
+
         lat1_rad = radians(lat1)
         lon1_rad = radians(lon1)
         lat2_rad = radians(lat2)
         lon2_rad = radians(lon2)
-        
+
         dlon = lon2_rad - lon1_rad
         dlat = lat2_rad - lat1_rad
-        
+
         a = sin(dlat / 2)**2 + cos(lat1_rad) * cos(lat2_rad) * sin(dlon / 2)**2
         c = 2 * atan2(sqrt(a), sqrt(1 - a))
-        
+
         distance = R * c
         return distance
-    
+
+    def calculate_distances_bulk(self, lat0: float, lon0: float,
+                                 lats, lons) -> np.ndarray:
+        """Distances in miles from one point to many, vectorized.
+
+        Haversine over NumPy arrays: each trig op is one C loop over the
+        whole coordinate set instead of a Python call per church, so
+        ranking hundreds of churches by distance is a single pass.
+        """
+        lat0_rad = radians(lat0)
+        lon0_rad = radians(lon0)
+        lat = np.radians(np.asarray(lats, dtype=np.float64))
+        lon = np.radians(np.asarray(lons, dtype=np.float64))
+
+        dlat = lat - lat0_rad
+        dlon = lon - lon0_rad
+        a = np.sin(dlat / 2)**2 + np.cos(lat0_rad) * np.cos(lat) * np.sin(dlon / 2)**2
+        return 3959.0 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
     def geocode_address(self, address: str) -> Optional[Tuple[float, float]]:
-        """Convert address to coordinates"""
+        """Convert address to coordinates (cached per unique address)"""
         try:
-            location = self.geolocator.geocode(address, timeout=10)
-            if location:
-                return location.latitude, location.longitude
-            return None
+            return _geocode_cached(address)
         except Exception as e:
             logger.error(f"Error geocoding address '{address}': {e}")
             return None
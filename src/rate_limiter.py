@@ -0,0 +1,57 @@
+"""Token-bucket rate limiter for outbound API calls"""
+
+import os
+import time
+import threading
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers acquire() one token per request; tokens refill continuously
+    at `rate` per second up to `capacity`. Unlike a fixed sleep between
+    requests, bursts up to the bucket capacity pass through immediately
+    and the steady state runs at the full permitted rate.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0):
+        """Block until the requested tokens are available, then consume them"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._last_refill) * self.rate
+                )
+                self._last_refill = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+    def penalize(self):
+        """Drive the bucket negative after a rate-limit response.
+
+        Call on an HTTP 429: every caller then waits at least a full
+        refill interval before the next request instead of immediately
+        re-hitting the quota wall.
+        """
+        with self._lock:
+            self._tokens = min(self._tokens - self.rate, -1.0)
+
+
+def places_rate_limiter() -> TokenBucket:
+    """Bucket for Google Places calls, rate configurable via PLACES_QPS"""
+    return TokenBucket(rate=float(os.getenv('PLACES_QPS', '10')))
@@ -14,31 +14,34 @@ class EventScheduler:
         self.config = config
         self.discovery_callback = discovery_callback
         self.scheduler = BackgroundScheduler()
-    
+        # Parse the schedule config and build the trigger once up front
+        # instead of re-splitting the run_time string on every start
+        self._schedule = self.config.get('scraping.schedule', 'daily')
+        self._run_time = self.config.get('scraping.run_time', '08:00')
+        self._trigger = self._build_trigger()
+
+    def _build_trigger(self) -> CronTrigger:
+        """Build the cron trigger from the configured schedule"""
+        hour, minute = self._run_time.split(':')
+        hour, minute = int(hour), int(minute)
+
+        if self._schedule == 'weekly':
+            return CronTrigger(day_of_week='mon', hour=hour, minute=minute)
+        if self._schedule != 'daily':
+            logger.warning(f"Unknown schedule: {self._schedule}, defaulting to daily")
+        return CronTrigger(hour=hour, minute=minute)
+
     def start(self):
         """Start the scheduler"""
-        schedule = self.config.get('scraping.schedule', 'daily')
-        run_time = self.config.get('scraping.run_time', '08:00')
-        
-        hour, minute = run_time.split(':')
-        
-        if schedule == 'daily':
-            trigger = CronTrigger(hour=hour, minute=minute)
-        elif schedule == 'weekly':
-            trigger = CronTrigger(day_of_week='mon', hour=hour, minute=minute)
-        else:
-            logger.warning(f"Unknown schedule: {schedule}, defaulting to daily")
-            trigger = CronTrigger(hour=hour, minute=minute)
-        
         self.scheduler.add_job(
             self.discovery_callback,
-            trigger=trigger,
+            trigger=self._trigger,
             id='event_discovery',
             name='Discover Coptic Service Events'
         )
         
         self.scheduler.start()
-        logger.info(f"Scheduler started: {schedule} at {run_time}")
+        logger.info(f"Scheduler started: {self._schedule} at {self._run_time}")
     
     def stop(self):
         """Stop the scheduler"""
@@ -0,0 +1,100 @@
+"""Regression test: freshly fetched churches must not be flagged as duplicates
+
+The fetch layer records every place_id it returns into the shared
+seen-place-ids set (so other regions skip paying for the same fetch);
+run-level dedup must therefore key off churches accepted this run, not
+that set - probing it would classify every clean fetch as a duplicate
+and silently zero out discovery.
+
+No network or API key needed - the Places layer is stubbed.
+
+Usage:
+    python test_dedup.py
+"""
+import os
+import tempfile
+
+from src.google_places_discovery import GooglePlaceChurch
+from src.global_church_discovery import GlobalChurchDatabase
+
+
+def make_church(i: int) -> GooglePlaceChurch:
+    return GooglePlaceChurch(
+        place_id=f'test-pid-{i}',
+        name=f'St Test {i} Coptic Orthodox Church',
+        address=f'{i} Main St, Clark, NJ 07066, USA',
+        latitude=40.0 + i * 0.01,
+        longitude=-74.3,
+        city='Clark',
+        state='NJ',
+        country='USA',
+    )
+
+
+print("\n" + "=" * 80)
+print("TESTING FETCH/DEDUP INTERPLAY")
+print("=" * 80)
+
+db = GlobalChurchDatabase(api_key='test-key-no-network')
+fetched = [make_church(i) for i in range(5)]
+
+# Simulate the fetch layer: search_churches_in_state adds every id it
+# returns to the shared set before the main thread ever sees the church
+for c in fetched:
+    db._seen_place_ids.add(c.place_id)
+
+# 1. A freshly fetched, never-seen church must NOT be a duplicate
+for c in fetched:
+    is_dup, reason = db._check_and_record(c, db._seen_place_ids)
+    assert not is_dup, f"Fresh church flagged as duplicate: {c.name} ({reason})"
+print(f"✅ {len(fetched)} fresh churches accepted")
+
+# 2. The same place surfacing again (e.g. via a country text search)
+# must be flagged by the exact-id check
+for c in fetched:
+    is_dup, reason = db._check_and_record(c, db._seen_place_ids)
+    assert is_dup, f"Repeat church not flagged: {c.name}"
+    assert reason == "same place_id", f"Unexpected reason: {reason}"
+print(f"✅ {len(fetched)} repeat sightings flagged as duplicates")
+
+assert len(db.all_churches) == len(fetched)
+
+# 3. End to end: a clean region run must persist every fetched church
+# (this is the failure mode that motivated the test - a run that
+# accepted nothing still checkpointed the region with a yield of 0)
+db2 = GlobalChurchDatabase(api_key='test-key-no-network')
+db2.REGIONS = [('NJ', 'New Jersey')]  # Override with test region
+
+
+def fake_search(state, max_results=60, seen_place_ids=None):
+    churches = [make_church(i) for i in range(5)]
+    if seen_place_ids is not None:
+        for c in churches:
+            seen_place_ids.add(c.place_id)
+    return churches
+
+
+db2.discovery.search_churches_in_state = fake_search
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    db_path = os.path.join(tmpdir, 'test_dedup.db')
+    churches = db2.discover_all_churches(max_per_region=10, db_path=db_path)
+
+    assert len(churches) == 5, f"Expected 5 churches, got {len(churches)}"
+
+    import sqlite3
+    conn = sqlite3.connect(db_path)
+    persisted = conn.execute('SELECT COUNT(*) FROM churches').fetchone()[0]
+    recorded_yield = conn.execute(
+        "SELECT last_count FROM region_yields WHERE region_code = 'NJ'"
+    ).fetchone()[0]
+    conn.close()
+
+    assert persisted == 5, f"Expected 5 persisted rows, got {persisted}"
+    assert recorded_yield == 5, f"Expected recorded yield 5, got {recorded_yield}"
+
+print("✅ Clean region run persisted all 5 churches (yield recorded as 5)")
+
+print("\n" + "=" * 80)
+print("✅ All dedup regression checks passed")
+print("=" * 80)
@@ -52,28 +52,15 @@ def main():
             logger.info(f"      📍 {getattr(church, 'city', 'Unknown')}, {getattr(church, 'state', '?')}")
             logger.info(f"      🌐 {church.website or 'No website'}")
         
-        # Now save to DB
+        # Now save to DB in one transaction instead of a commit per church
         logger.info(f"\n💾 Saving to database...")
         db = EventDatabase()
-        
-        for church in churches:
-            try:
-                db.add_church(
-                    name=church.name,
-                    address=church.address,
-                    city=getattr(church, 'city', ''),
-                    state=getattr(church, 'state', ''),
-                    country=getattr(church, 'country', 'USA'),
-                    website=church.website,
-                    latitude=church.latitude,
-                    longitude=church.longitude,
-                    place_id=church.place_id,
-                    phone=getattr(church, 'phone', None)
-                )
-            except Exception as e:
-                logger.error(f"   ❌ Failed to save {church.name}: {e}")
-        
-        logger.info(f"✅ Saved {len(churches)} churches to database")
+
+        try:
+            saved = db.add_churches_bulk(churches)
+            logger.info(f"✅ Saved {saved} churches to database")
+        except Exception as e:
+            logger.error(f"   ❌ Failed to save churches: {e}")
         
     except Exception as e:
         logger.error(f"❌ ERROR: {e}", exc_info=True)
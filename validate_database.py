@@ -6,158 +6,246 @@ Checks location accuracy, data completeness, and potential issues
 
 import sqlite3
 import sys
-from collections import defaultdict
+
+_BAR = "=" * 80
+
+# One round-trip for the top duplicate groups: group_concat assembles
+# the "City (address...)" display string inside SQLite, so no member
+# rows cross the driver boundary and no Python regrouping is needed
+_DUP_DETAILS_SQL = """
+    SELECT state, name, COUNT(*) AS count,
+           group_concat(
+               city || COALESCE(' (' || substr(address, 1, 30) || '...)', ''),
+               ', '
+           ) AS cities
+    FROM google_places_churches
+    WHERE state IS NOT NULL
+    GROUP BY state, name
+    HAVING count > 1
+    ORDER BY count DESC
+    LIMIT 5
+"""
+
+
+class Validator:
+    """Validation report generator with a persistent connection.
+
+    Callers running many reports (watch loops, CI) construct one
+    Validator and call report() repeatedly: the connection, PRAGMA
+    setup, and sqlite3's prepared-statement cache all carry over
+    between runs instead of being rebuilt per invocation.
+    """
+
+    def __init__(self, db_path='coptic_events.db'):
+        self.db_path = db_path
+        # detect_types=0 and a None row_factory pin the fast C tuple
+        # path: no declared-type parsing and no column-name binding
+        # per row
+        self.conn = sqlite3.connect(db_path, detect_types=0)
+        self.conn.row_factory = None
+
+        # Read-side tuning: mmap lets SQLite serve pages straight from
+        # the OS cache, the 64MB page cache keeps the table hot across
+        # the aggregate and duplicate queries, and query_only guards the
+        # report against ever writing (it goes last so the other PRAGMAs
+        # can still apply)
+        for pragma in ('mmap_size=268435456', 'cache_size=-65536',
+                       'temp_store=MEMORY', 'query_only=ON'):
+            self.conn.execute(f'PRAGMA {pragma}')
+
+    def close(self):
+        """Close the report connection"""
+        self.conn.close()
+
+    def report(self) -> bool:
+        """Generate one validation report on stdout"""
+        # Buffer the report and emit it as one write instead of ~50
+        # individual print calls, each taking the stdio lock and a syscall
+        out = []
+        p = out.append
+
+        try:
+            cursor = self.conn.cursor()
+            # Batch row marshaling if any result set is iterated rather
+            # than fetched whole
+            cursor.arraysize = 256
+
+            # Check if table exists
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='google_places_churches'")
+            if not cursor.fetchone():
+                p("❌ No church database found. Run discovery first.")
+                return False
+
+            # Covering index for the (state, name) grouping and joins: the
+            # duplicate queries stream ordered groups from the index instead
+            # of scanning and sorting the table. Built via a short-lived
+            # writable connection (the report connection is query_only);
+            # skipped quietly if the database file isn't writable.
+            try:
+                with sqlite3.connect(self.db_path) as wconn:
+                    wconn.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_gpc_state_name
+                        ON google_places_churches(state, name)
+                    """)
+            except sqlite3.Error:
+                pass
+
+            p(_BAR)
+            p("🔍 CHURCH DATABASE VALIDATION REPORT")
+            p(_BAR)
+
+            # 1. Counts and quality metrics, fused into one table scan
+            # instead of eight separate COUNT(*) round-trips
+            cursor.execute("""
+                SELECT
+                    COUNT(*),
+                    SUM(CASE WHEN website IS NOT NULL AND website != '' THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN phone IS NOT NULL AND phone != '' THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN address IS NOT NULL AND address != '' THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN latitude IS NOT NULL AND longitude IS NOT NULL THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN state IS NULL OR state = '' THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN (website IS NULL OR website = '')
+                              AND (phone IS NULL OR phone = '') THEN 1 ELSE 0 END),
+                    AVG(rating),
+                    AVG(CASE WHEN rating IS NOT NULL THEN user_ratings_total END)
+                FROM google_places_churches
+            """)
+            (total, with_website, with_phone, with_address, with_coords,
+             missing_state, no_contact, avg_rating, avg_reviews) = cursor.fetchone()
+
+            # Nothing else to report (and the completeness percentages
+            # would divide by zero) on an empty table
+            if total == 0:
+                p("❌ Empty database - run discovery first.")
+                return False
+
+            p(f"\n📊 Total Churches: {total}")
+
+            # 2. State distribution: only the ten displayed rows cross the
+            # driver boundary; the "more states" line comes from a cheap
+            # DISTINCT count instead of materializing every state tuple
+            p(f"\n📍 Churches by State:")
+            cursor.execute("""
+                SELECT state, COUNT(*) as count
+                FROM google_places_churches
+                WHERE state IS NOT NULL
+                GROUP BY state
+                ORDER BY count DESC
+                LIMIT 10
+            """)
+
+            state_counts = cursor.fetchall()
+            for state, count in state_counts:
+                p(f"   {state}: {count}")
+
+            cursor.execute("""
+                SELECT COUNT(DISTINCT state) FROM google_places_churches
+                WHERE state IS NOT NULL
+            """)
+            n_states = cursor.fetchone()[0]
+            if n_states > 10:
+                p(f"   ... and {n_states - 10} more states")
+
+            # 3. Data completeness
+            p(f"\n✅ Data Completeness:")
+            p(f"   Websites: {with_website}/{total} ({100*with_website/total:.1f}%)")
+            p(f"   Phone numbers: {with_phone}/{total} ({100*with_phone/total:.1f}%)")
+            p(f"   Addresses: {with_address}/{total} ({100*with_address/total:.1f}%)")
+            p(f"   Coordinates: {with_coords}/{total} ({100*with_coords/total:.1f}%)")
+
+            # 4. Quality metrics
+            p(f"\n⭐ Quality Metrics:")
+            if avg_rating:
+                p(f"   Average rating: {avg_rating:.2f}/5.0")
+                p(f"   Average reviews: {avg_reviews:.1f}")
+
+            # 5. Potential issues
+            p(f"\n⚠️  Potential Issues:")
+            issues = []
+
+            # Missing state
+            if missing_state > 0:
+                issues.append(f"   {missing_state} churches missing state")
+
+            # No website or phone
+            if no_contact > 0:
+                issues.append(f"   {no_contact} churches with no website or phone")
+
+            # Duplicate names in same state: count the groups server-side
+            # instead of materializing every (state, name) tuple just to
+            # len() it
+            cursor.execute("""
+                SELECT COUNT(*) FROM (
+                    SELECT 1
+                    FROM google_places_churches
+                    WHERE state IS NOT NULL
+                    GROUP BY state, name
+                    HAVING COUNT(*) > 1
+                )
+            """)
+            n_duplicates = cursor.fetchone()[0]
+            if n_duplicates:
+                issues.append(f"   {n_duplicates} potential duplicate church names")
+                issues.append(f"      (These may be legitimate - e.g., same name, different cities)")
+
+                cursor.execute(_DUP_DETAILS_SQL)
+                for state, name, count, cities in cursor.fetchall():
+                    issues.append(f"      - {state}: '{name}' ({count}x) in {cities}")
+
+            if issues:
+                for issue in issues:
+                    p(issue)
+            else:
+                p("   ✅ No issues found!")
+
+            # 6. Sample churches
+            p(f"\n📋 Sample Churches (first 5):")
+            # Explicit rowid order: same storage-order scan, but the sample
+            # is stable across runs instead of planner-dependent
+            cursor.execute("""
+                SELECT name, city, state, website, phone
+                FROM google_places_churches
+                ORDER BY rowid
+                LIMIT 5
+            """)
+            for name, city, state, website, phone in cursor.fetchall():
+                p(f"   • {name}")
+                p(f"     📍 {city}, {state}")
+                if website:
+                    p(f"     🌐 {website}")
+                if phone:
+                    p(f"     📞 {phone}")
+                p('')
+
+            p(_BAR)
+            p(f"✅ Validation complete! Database has {total} churches")
+            p(_BAR)
+
+            return True
+
+        except sqlite3.Error as e:
+            # Only database errors are expected here; programmer bugs
+            # should propagate instead of being swallowed into the report
+            p(f"❌ Error validating database: {e}")
+            return False
+        finally:
+            if out:
+                sys.stdout.write('\n'.join(out) + '\n')
+
 
 def validate_database(db_path='coptic_events.db'):
     """Generate comprehensive validation report"""
-    
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Check if table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='google_places_churches'")
-        if not cursor.fetchone():
-            print("❌ No church database found. Run discovery first.")
-            return False
-        
-        print("="*80)
-        print("🔍 CHURCH DATABASE VALIDATION REPORT")
-        print("="*80)
-        
-        # 1. Total count
-        cursor.execute("SELECT COUNT(*) FROM google_places_churches")
-        total = cursor.fetchone()[0]
-        print(f"\n📊 Total Churches: {total}")
-        
-        # 2. State distribution
-        print(f"\n📍 Churches by State:")
-        cursor.execute("""
-            SELECT state, COUNT(*) as count
-            FROM google_places_churches
-            WHERE state IS NOT NULL
-            GROUP BY state
-            ORDER BY count DESC
-        """)
-        
-        state_counts = cursor.fetchall()
-        for state, count in state_counts[:10]:
-            print(f"   {state}: {count}")
-        if len(state_counts) > 10:
-            print(f"   ... and {len(state_counts) - 10} more states")
-        
-        # 3. Data completeness
-        print(f"\n✅ Data Completeness:")
-        cursor.execute("SELECT COUNT(*) FROM google_places_churches WHERE website IS NOT NULL AND website != ''")
-        with_website = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM google_places_churches WHERE phone IS NOT NULL AND phone != ''")
-        with_phone = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM google_places_churches WHERE address IS NOT NULL AND address != ''")
-        with_address = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM google_places_churches WHERE latitude IS NOT NULL AND longitude IS NOT NULL")
-        with_coords = cursor.fetchone()[0]
-        
-        print(f"   Websites: {with_website}/{total} ({100*with_website/total:.1f}%)")
-        print(f"   Phone numbers: {with_phone}/{total} ({100*with_phone/total:.1f}%)")
-        print(f"   Addresses: {with_address}/{total} ({100*with_address/total:.1f}%)")
-        print(f"   Coordinates: {with_coords}/{total} ({100*with_coords/total:.1f}%)")
-        
-        # 4. Quality metrics
-        print(f"\n⭐ Quality Metrics:")
-        cursor.execute("""
-            SELECT 
-                AVG(rating) as avg_rating,
-                AVG(user_ratings_total) as avg_reviews
-            FROM google_places_churches
-            WHERE rating IS NOT NULL
-        """)
-        avg_rating, avg_reviews = cursor.fetchone()
-        if avg_rating:
-            print(f"   Average rating: {avg_rating:.2f}/5.0")
-            print(f"   Average reviews: {avg_reviews:.1f}")
-        
-        # 5. Potential issues
-        print(f"\n⚠️  Potential Issues:")
-        issues = []
-        
-        # Missing state
-        cursor.execute("SELECT COUNT(*) FROM google_places_churches WHERE state IS NULL OR state = ''")
-        missing_state = cursor.fetchone()[0]
-        if missing_state > 0:
-            issues.append(f"   {missing_state} churches missing state")
-        
-        # No website or phone
-        cursor.execute("""
-            SELECT COUNT(*) FROM google_places_churches 
-            WHERE (website IS NULL OR website = '') 
-            AND (phone IS NULL OR phone = '')
-        """)
-        no_contact = cursor.fetchone()[0]
-        if no_contact > 0:
-            issues.append(f"   {no_contact} churches with no website or phone")
-        
-        # Duplicate names in same state
-        cursor.execute("""
-            SELECT state, name, COUNT(*) as count
-            FROM google_places_churches
-            WHERE state IS NOT NULL
-            GROUP BY state, name
-            HAVING count > 1
-            ORDER BY count DESC
-        """)
-        duplicates = cursor.fetchall()
-        if duplicates:
-            issues.append(f"   {len(duplicates)} potential duplicate church names")
-            issues.append(f"      (These may be legitimate - e.g., same name, different cities)")
-            for state, name, count in duplicates[:5]:
-                # Get cities for these duplicates
-                cursor.execute("""
-                    SELECT city, address 
-                    FROM google_places_churches 
-                    WHERE state = ? AND name = ?
-                    LIMIT 3
-                """, (state, name))
-                cities = cursor.fetchall()
-                city_list = [f"{city} ({addr[:30]}...)" if addr else city for city, addr in cities]
-                issues.append(f"      - {state}: '{name}' ({count}x) in {', '.join(city_list[:2])}")
-                if len(city_list) > 2:
-                    issues.append(f"        ... and {len(city_list) - 2} more locations")
-        
-        if issues:
-            for issue in issues:
-                print(issue)
-        else:
-            print("   ✅ No issues found!")
-        
-        # 6. Sample churches
-        print(f"\n📋 Sample Churches (first 5):")
-        cursor.execute("""
-            SELECT name, city, state, website, phone
-            FROM google_places_churches
-            LIMIT 5
-        """)
-        for name, city, state, website, phone in cursor.fetchall():
-            print(f"   • {name}")
-            print(f"     📍 {city}, {state}")
-            if website:
-                print(f"     🌐 {website}")
-            if phone:
-                print(f"     📞 {phone}")
-            print()
-        
-        print("="*80)
-        print(f"✅ Validation complete! Database has {total} churches")
-        print("="*80)
-        
-        conn.close()
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error validating database: {e}")
+        validator = Validator(db_path)
+    except sqlite3.Error as e:
+        sys.stdout.write(f"❌ Error validating database: {e}\n")
         return False
 
+    try:
+        return validator.report()
+    finally:
+        validator.close()
+
+
 if __name__ == '__main__':
     validate_database()